@@ -1369,7 +1369,7 @@ class Lag2ndOrd(Block):
     """
 
     def __init__(self, u, K, T1, T2, name=None, tex_name=None, info=None):
-        super(Lag2ndOrd, self).__init__(name=name, tex_name=tex_name, info=info)
+        super().__init__(name=name, tex_name=tex_name, info=info)
 
         self.u = dummify(u)
         self.K = dummify(K)
@@ -1516,7 +1516,7 @@ class LeadLag2ndOrd(Block):
     """
 
     def __init__(self, u, T1, T2, T3, T4, zero_out=False, name=None, tex_name=None, info=None):
-        super(LeadLag2ndOrd, self).__init__(name=name, tex_name=tex_name, info=info)
+        super().__init__(name=name, tex_name=tex_name, info=info)
         self.u = dummify(u)
         self.T1 = dummify(T1)
         self.T2 = dummify(T2)
@@ -5,7 +5,7 @@ from collections import OrderedDict, defaultdict
 from typing import Iterable
 
 
-from andes.shared import jac_full_names, jac_names, jac_types
+from andes.shared import jac_full_names
 from andes.utils.tab import make_doc_table, math_wrap
 
 logger = logging.getLogger(__name__)
@@ -120,6 +120,8 @@ class JacTriplet:
     Storage class for Jacobian triplet lists.
     """
 
+    __slots__ = ('ijac', 'jjac', 'vjac')
+
     def __init__(self):
         self.ijac = defaultdict(list)
         self.jjac = defaultdict(list)
@@ -170,11 +172,10 @@ class JacTriplet:
         """
         Merge another triplet into this one.
         """
-        for jname in jac_names:
-            for jtype in jac_types:
-                self.ijac[jname + jtype] += triplet.ijac[jname + jtype]
-                self.jjac[jname + jtype] += triplet.jjac[jname + jtype]
-                self.vjac[jname + jtype] += triplet.vjac[jname + jtype]
+        for j_full_name in jac_full_names:
+            self.ijac[j_full_name] += triplet.ijac[j_full_name]
+            self.jjac[j_full_name] += triplet.jjac[j_full_name]
+            self.vjac[j_full_name] += triplet.vjac[j_full_name]
 
 
 class Config:
@@ -321,15 +322,15 @@ class Config:
 
         tex = math_wrap(tex, export=export)
 
-        plain_dict = OrderedDict([('Option', names),
-                                  ('Value', value),
-                                  ('Info', info),
-                                  ('Acceptable values', alt)])
-        rest_dict = OrderedDict([('Option', names),
-                                 ('Symbol', tex),
-                                 ('Value', value),
-                                 ('Info', info),
-                                 ('Accepted values', alt)])
+        plain_dict = {'Option': names,
+                      'Value': value,
+                      'Info': info,
+                      'Acceptable values': alt}
+        rest_dict = {'Option': names,
+                     'Symbol': tex,
+                     'Value': value,
+                     'Info': info,
+                     'Accepted values': alt}
 
         if not symbol:
             rest_dict.pop("Symbol")
@@ -131,7 +131,7 @@ class Discrete:
         """
 
         for flag in self.export_flags:
-            self.__dict__[flag] = self.__dict__[flag] * np.ones(n, dtype=float)
+            self.__dict__[flag] = np.full(n, self.__dict__[flag], dtype=float)
 
     def warn_init_limit(self):
         """
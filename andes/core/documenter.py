@@ -3,7 +3,6 @@ Documenter class for ANDES models.
 """
 
 import inspect
-from collections import OrderedDict
 
 from andes.utils.tab import make_doc_table, math_wrap
 
@@ -29,6 +28,40 @@ class Documenter:
         self.discrete = parent.discrete
         self.blocks = parent.blocks
 
+        self._latex_store = None  # `ModelCall` that `_latex_cache` is built from
+        self._latex_cache = dict()
+
+    def _wrap_latex(self, *names):
+        """
+        Get the LaTeX strings stored in ``ModelCall`` under `names`, wrapped for reST.
+
+        Wrapped strings are cached until the ``ModelCall`` of the model is replaced.
+
+        Parameters
+        ----------
+        names : str
+            Attribute names in ``ModelCall``, such as ``x_latex`` and ``f_latex``.
+            The strings of multiple attributes are concatenated.
+
+        Returns
+        -------
+        list
+            A list of strings wrapped with ``:math:``
+        """
+        call_store = self.system.calls[self.class_name]
+        if self._latex_store is not call_store:
+            self._latex_store = call_store
+            self._latex_cache = dict()
+
+        if names not in self._latex_cache:
+            tex = list()
+            for name in names:
+                value = getattr(call_store, name)
+                tex.extend(value.values() if isinstance(value, dict) else value)
+            self._latex_cache[names] = math_wrap(tex, export='rest')
+
+        return self._latex_cache[names]
+
     def _param_doc(self, max_width=78, export='plain'):
         """
         Export formatted model parameter documentation as a string.
@@ -62,11 +95,7 @@ class Documenter:
             units.append(f'{p.unit}' if p.unit else '')
             units_rest.append(f'*{p.unit}*' if p.unit else '')
 
-            plist = []
-            for key, val in p.property.items():
-                if val is True:
-                    plist.append(key)
-            properties.append(','.join(plist))
+            properties.append(','.join(key for key, val in p.property.items() if val is True))
 
         # symbols based on output format
         if export == 'rest':
@@ -77,18 +106,18 @@ class Documenter:
             symbols = [item.name for item in self.params.values()]
             title = 'Parameters'
 
-        plain_dict = OrderedDict([('Name', names),
-                                  ('Description', info),
-                                  ('Default', defaults),
-                                  ('Unit', units),
-                                  ('Properties', properties)])
+        plain_dict = {'Name': names,
+                      'Description': info,
+                      'Default': defaults,
+                      'Unit': units,
+                      'Properties': properties}
 
-        rest_dict = OrderedDict([('Name', names),
-                                 ('Symbol', symbols),
-                                 ('Description', info),
-                                 ('Default', defaults),
-                                 ('Unit', units_rest),
-                                 ('Properties', properties)])
+        rest_dict = {'Name': names,
+                     'Symbol': symbols,
+                     'Description': info,
+                     'Default': defaults,
+                     'Unit': units_rest,
+                     'Properties': properties}
 
         # convert to rows and export as table
         return make_doc_table(title=title,
@@ -106,6 +135,8 @@ class Documenter:
         properties, info = list(), list()
         units_rest, ty = list(), list()
 
+        all_properties = ('v_str', 'v_setter', 'e_setter', 'v_iter')
+
         for p in self.cache.all_vars.values():
             names.append(p.name)
             ty.append(p.class_name)
@@ -114,10 +145,10 @@ class Documenter:
             units_rest.append(f'*{p.unit}*' if p.unit else '')
 
             # collect properties
-            all_properties = ['v_str', 'v_setter', 'e_setter', 'v_iter']
             plist = []
             for item in all_properties:
-                if (p.__dict__[item] is not None) and (p.__dict__[item] is not False):
+                value = getattr(p, item, None)
+                if (value is not None) and (value is not False):
                     plist.append(item)
             properties.append(','.join(plist))
 
@@ -125,22 +156,21 @@ class Documenter:
 
         # replace with latex math expressions if export is ``rest``
         if export == 'rest':
-            call_store = self.system.calls[self.class_name]
-            symbols = math_wrap(call_store.x_latex + call_store.y_latex, export=export)
+            symbols = self._wrap_latex('x_latex', 'y_latex')
             title = 'Variables\n---------'
 
-        plain_dict = OrderedDict([('Name', names),
-                                  ('Type', ty),
-                                  ('Description', info),
-                                  ('Unit', units),
-                                  ('Properties', properties)])
+        plain_dict = {'Name': names,
+                      'Type': ty,
+                      'Description': info,
+                      'Unit': units,
+                      'Properties': properties}
 
-        rest_dict = OrderedDict([('Name', names),
-                                 ('Symbol', symbols),
-                                 ('Type', ty),
-                                 ('Description', info),
-                                 ('Unit', units_rest),
-                                 ('Properties', properties)])
+        rest_dict = {'Name': names,
+                     'Symbol': symbols,
+                     'Type': ty,
+                     'Description': info,
+                     'Unit': units_rest,
+                     'Properties': properties}
 
         return make_doc_table(title=title,
                               max_width=max_width,
@@ -168,21 +198,20 @@ class Documenter:
 
         # replace with latex math expressions if export is ``rest``
         if export == 'rest':
-            call_store = self.system.calls[self.class_name]
-            symbols = math_wrap(call_store.x_latex + call_store.y_latex, export=export)
-            ivs_rest = math_wrap(call_store.init_latex.values(), export=export)
+            symbols = self._wrap_latex('x_latex', 'y_latex')
+            ivs_rest = self._wrap_latex('init_latex')
             title = 'Initialization Equations\n------------------------'
 
-        plain_dict = OrderedDict([('Name', names),
-                                  ('Type', ty),
-                                  ('Initial Value', ivs),
-                                  ])
+        plain_dict = {'Name': names,
+                      'Type': ty,
+                      'Initial Value': ivs,
+                      }
 
-        rest_dict = OrderedDict([('Name', names),
-                                 ('Symbol', symbols),
-                                 ('Type', ty),
-                                 ('Initial Value', ivs_rest),
-                                 ])
+        rest_dict = {'Name': names,
+                     'Symbol': symbols,
+                     'Type': ty,
+                     'Initial Value': ivs_rest,
+                     }
 
         return make_doc_table(title=title,
                               max_width=max_width,
@@ -227,27 +256,24 @@ class Documenter:
                     lhs_names.append(p.t_const.name if p.t_const else '')
                     lhs_tex_names.append(p.t_const.tex_name if p.t_const else '')
 
-            plain_dict = OrderedDict([('Name', names),
-                                      ('Type', class_names),
-                                      (f'RHS of Equation "{e2form[e_name]}"', eqs),
-                                      ])
+            plain_dict = {'Name': names,
+                          'Type': class_names,
+                          f'RHS of Equation "{e2form[e_name]}"': eqs,
+                          }
             title = f'{e2full[e_name]} Equations'
             if export == 'rest':
-                call_store = self.system.calls[self.class_name]
-                e2var_sym = {'f': call_store.x_latex,
-                             'g': call_store.y_latex}
-                e2eq_sym = {'f': call_store.f_latex,
-                            'g': call_store.g_latex}
-
-                symbols = math_wrap(e2var_sym[e_name], export=export)
-                eqs_rest = math_wrap(e2eq_sym[e_name], export=export)
+                e2var_sym = {'f': 'x_latex', 'g': 'y_latex'}
+                e2eq_sym = {'f': 'f_latex', 'g': 'g_latex'}
+
+                symbols = self._wrap_latex(e2var_sym[e_name])
+                eqs_rest = self._wrap_latex(e2eq_sym[e_name])
                 title = f'{e2full[e_name]} Equations\n-----------------------------'
 
-            rest_dict = OrderedDict([('Name', names),
-                                     ('Symbol', symbols),
-                                     ('Type', class_names),
-                                     (f'RHS of Equation "{e2form[e_name]}"', eqs_rest),
-                                     ])
+            rest_dict = {'Name': names,
+                         'Symbol': symbols,
+                         'Type': class_names,
+                         f'RHS of Equation "{e2form[e_name]}"': eqs_rest,
+                         }
 
             if e_name == 'f':
                 plain_dict['T (LHS)'] = lhs_names
@@ -276,19 +302,18 @@ class Documenter:
 
         title = 'Services'
         if export == 'rest':
-            call_store = self.system.calls[self.class_name]
             symbols = math_wrap(symbols, export=export)
-            eqs_rest = math_wrap(call_store.s_latex, export=export)
+            eqs_rest = self._wrap_latex('s_latex')
             title = 'Services\n----------'
 
-        plain_dict = OrderedDict([('Name', names),
-                                  ('Equation', eqs),
-                                  ('Type', class_names)])
+        plain_dict = {'Name': names,
+                      'Equation': eqs,
+                      'Type': class_names}
 
-        rest_dict = OrderedDict([('Name', names),
-                                 ('Symbol', symbols),
-                                 ('Equation', eqs_rest),
-                                 ('Type', class_names)])
+        rest_dict = {'Name': names,
+                     'Symbol': symbols,
+                     'Equation': eqs_rest,
+                     'Type': class_names}
 
         return make_doc_table(title=title,
                               max_width=max_width,
@@ -313,14 +338,14 @@ class Documenter:
             symbols = math_wrap([item.tex_name for item in self.discrete.values()], export=export)
             title = 'Discretes\n-----------'
 
-        plain_dict = OrderedDict([('Name', names),
-                                  ('Type', class_names),
-                                  ('Info', info)])
+        plain_dict = {'Name': names,
+                      'Type': class_names,
+                      'Info': info}
 
-        rest_dict = OrderedDict([('Name', names),
-                                 ('Symbol', symbols),
-                                 ('Type', class_names),
-                                 ('Info', info)])
+        rest_dict = {'Name': names,
+                     'Symbol': symbols,
+                     'Type': class_names,
+                     'Info': info}
 
         return make_doc_table(title=title,
                               max_width=max_width,
@@ -348,14 +373,14 @@ class Documenter:
             symbols = math_wrap([item.tex_name for item in self.blocks.values()], export=export)
             title = 'Blocks\n-------'
 
-        plain_dict = OrderedDict([('Name', names),
-                                  ('Type', class_names),
-                                  ('Info', info)])
+        plain_dict = {'Name': names,
+                      'Type': class_names,
+                      'Info': info}
 
-        rest_dict = OrderedDict([('Name', names),
-                                 ('Symbol', symbols),
-                                 ('Type', class_names),
-                                 ('Info', info)])
+        rest_dict = {'Name': names,
+                     'Symbol': symbols,
+                     'Type': class_names,
+                     'Info': info}
 
         return make_doc_table(title=title,
                               max_width=max_width,
@@ -382,6 +407,11 @@ class Documenter:
         out = ''
         if export == 'rest':
             max_width = 0
+
+            # LaTeX symbols are only used by ``rest`` and are generated on demand
+            if self.parent.syms.pretty_print_pending:
+                self.parent.syms.generate_pretty_print()
+
             model_header = '-' * 80 + '\n'
             out += f'.. _{self.class_name}:\n\n'
         else:
@@ -17,7 +17,6 @@ from textwrap import wrap
 from typing import Callable, Iterable, Union
 
 import numpy as np
-import scipy as sp
 from andes.core.block import Block
 from andes.core.common import Config, JacTriplet, ModelFlags
 from andes.core.discrete import Discrete
@@ -50,7 +49,7 @@ class Model:
 
     Attributes
     ----------
-    num_params : OrderedDict
+    num_params : dict
         {name: instance} of numerical parameters, including internal and
         external ones
 
@@ -183,38 +182,38 @@ class Model:
         self.group_var_exception = list()
 
         if not hasattr(self, 'num_params'):
-            self.num_params = OrderedDict()
+            self.num_params = dict()
         if not hasattr(self, 'cache'):
             self.cache = ModelCache()
 
         # variables
-        self.states = OrderedDict()  # internal states
-        self.states_ext = OrderedDict()  # external states
-        self.algebs = OrderedDict()  # internal algebraic variables
-        self.algebs_ext = OrderedDict()  # external algebraic vars
-        self.vars_decl_order = OrderedDict()  # variable in the order of declaration
-
-        self.params_ext = OrderedDict()  # external parameters
-
-        self.discrete = OrderedDict()  # discrete comp.
-        self.blocks = OrderedDict()  # blocks
-
-        self.services = OrderedDict()  # service/temporary variables
-        self.services_var = OrderedDict()  # variable services updated each step/iter
-        self.services_var_seq = OrderedDict()
-        self.services_var_nonseq = OrderedDict()
-        self.services_post = OrderedDict()  # post-initialization storage services
-        self.services_subs = OrderedDict()  # to-be-substituted services
-        self.services_icheck = OrderedDict()  # post-initialization check services
-        self.services_ref = OrderedDict()  # BackRef
-        self.services_fnd = OrderedDict()  # services to find/add devices
-        self.services_ext = OrderedDict()  # external services (to be retrieved)
-        self.services_ops = OrderedDict()  # operational services (for special usages)
-
-        self.tex_names = OrderedDict((('dae_t', 't_{dae}'),
-                                      ('sys_f', 'f_{sys}'),
-                                      ('sys_mva', 'S_{b,sys}'),
-                                      ))
+        self.states = dict()  # internal states
+        self.states_ext = dict()  # external states
+        self.algebs = dict()  # internal algebraic variables
+        self.algebs_ext = dict()  # external algebraic vars
+        self.vars_decl_order = dict()  # variable in the order of declaration
+
+        self.params_ext = dict()  # external parameters
+
+        self.discrete = dict()  # discrete comp.
+        self.blocks = dict()  # blocks
+
+        self.services = dict()  # service/temporary variables
+        self.services_var = dict()  # variable services updated each step/iter
+        self.services_var_seq = dict()
+        self.services_var_nonseq = dict()
+        self.services_post = dict()  # post-initialization storage services
+        self.services_subs = dict()  # to-be-substituted services
+        self.services_icheck = dict()  # post-initialization check services
+        self.services_ref = dict()  # BackRef
+        self.services_fnd = dict()  # services to find/add devices
+        self.services_ext = dict()  # external services (to be retrieved)
+        self.services_ops = dict()  # operational services (for special usages)
+
+        self.tex_names = {'dae_t': 't_{dae}',
+                          'sys_f': 'f_{sys}',
+                          'sys_mva': 'S_{b,sys}',
+                          }
 
         # Model behavior flags
         self.flags = ModelFlags()
@@ -246,41 +245,61 @@ class Model:
 
         self.calls = ModelCall()  # callback and LaTeX string storage
         self.triplets = JacTriplet()  # Jacobian triplet storage
+        self._jac_sizes = dict()  # number of elements of each generated Jacobian
+        self._jac_views = dict()  # views into the triplet values of generated Jacobians
         self.syms = SymProcessor(self)  # symbolic processor instance
         self.docum = Documenter(self)
 
         # cached class attributes
-        self.cache.add_callback('all_vars', self._all_vars)
-        self.cache.add_callback('iter_vars', self._iter_vars)
-        self.cache.add_callback('input_vars', self._input_vars)
-        self.cache.add_callback('output_vars', self._output_vars)
-
-        self.cache.add_callback('all_vars_names', self._all_vars_names)
-        self.cache.add_callback('all_params', self._all_params)
-        self.cache.add_callback('all_params_names', self._all_params_names)
-        self.cache.add_callback('algebs_and_ext', self._algebs_and_ext)
-        self.cache.add_callback('states_and_ext', self._states_and_ext)
-        self.cache.add_callback('services_and_ext', self._services_and_ext)
-        self.cache.add_callback('vars_ext', self._vars_ext)
-        self.cache.add_callback('vars_int', self._vars_int)
+        # views that only depend on the model structure
+        structure = ('structure', )
+        self.cache.add_callback('all_vars', self._all_vars, deps=structure)
+        self.cache.add_callback('iter_vars', self._iter_vars, deps=structure)
+        self.cache.add_callback('input_vars', self._input_vars, deps=structure)
+        self.cache.add_callback('output_vars', self._output_vars, deps=structure)
+
+        self.cache.add_callback('all_vars_names', self._all_vars_names, deps=structure)
+        self.cache.add_callback('all_params', self._all_params, deps=structure)
+        self.cache.add_callback('all_params_names', self._all_params_names, deps=structure)
+        self.cache.add_callback('algebs_and_ext', self._algebs_and_ext, deps=structure)
+        self.cache.add_callback('states_and_ext', self._states_and_ext, deps=structure)
+        self.cache.add_callback('services_and_ext', self._services_and_ext, deps=structure)
+        self.cache.add_callback('vars_ext', self._vars_ext, deps=structure)
+        self.cache.add_callback('vars_int', self._vars_int, deps=structure)
+        self.cache.add_callback('e_clear_ext', self._e_clear_ext, deps=structure)
+        self.cache.add_callback('discrete_flags', self._discrete_flags, deps=structure)
+        self.cache.add_callback('param_inputs', self._param_inputs, deps=structure)
+        self.cache.add_callback('discrete_check_var', self._discrete_check_var, deps=structure)
+        self.cache.add_callback('discrete_check_eq', self._discrete_check_eq, deps=structure)
+
+        # views that depend on the memory flags of variables
         self.cache.add_callback('v_getters', self._v_getters)
         self.cache.add_callback('v_adders', self._v_adders)
         self.cache.add_callback('v_setters', self._v_setters)
         self.cache.add_callback('e_adders', self._e_adders)
         self.cache.add_callback('e_setters', self._e_setters)
-
-        self._input = OrderedDict()  # cached dictionary of inputs
-        self._input_z = OrderedDict()  # discrete flags, storage only.
-        self._rhs_f = OrderedDict()  # RHS of external f
-        self._rhs_g = OrderedDict()  # RHS of external g
-
-        self.f_args = []
-        self.g_args = []  # argument value lists
+        self.cache.add_callback('f_dispatch', self._f_dispatch)
+        self.cache.add_callback('g_dispatch', self._g_dispatch)
+
+        self._input = dict()  # cached dictionary of inputs
+        self._input_version = 0  # bumped when input arrays are reassigned
+        self._input_stamp = -1   # version when `_input` was last refreshed
+        self._input_args_stale = False  # True if argument lists lag behind `_input`
+        self._input_z = dict()  # discrete flags, storage only.
+        self._rhs_f = dict()  # RHS of external f
+        self._rhs_g = dict()  # RHS of external g
+
+        # flat storage of `v` and `e` of internal variables not sharing memory with DAE
+        self._v_buf = np.array([], dtype=float)
+        self._e_buf = np.array([], dtype=float)
+
+        self.f_args = ()
+        self.g_args = ()  # argument value tuples
         self.j_args = dict()
-        self.s_args = OrderedDict()
-        self.ia_args = OrderedDict()
-        self.ii_args = OrderedDict()
-        self.ij_args = OrderedDict()
+        self.s_args = dict()
+        self.ia_args = dict()
+        self.ii_args = dict()
+        self.ij_args = dict()
 
         self.coeffs = dict()  # pu conversion coefficient storage
         self.bases = dict()   # base storage, such as Vn, Vb, Zn, Zb
@@ -294,20 +313,14 @@ class Model:
         Subclass attributes are automatically registered based on the variable type.
         Block attributes will be exported and registered recursively.
         """
-        if isinstance(value, Algeb):
-            self.algebs[key] = value
-        elif isinstance(value, ExtAlgeb):
-            self.algebs_ext[key] = value
-        elif isinstance(value, State):
-            self.states[key] = value
-        elif isinstance(value, ExtState):
-            self.states_ext[key] = value
-        elif isinstance(value, ExtParam):
-            self.params_ext[key] = value
-        elif isinstance(value, Discrete):
-            self.discrete[key] = value
-        elif isinstance(value, ConstService):  # services with only `v_str`
-            self.services[key] = value
+        bucket = _attribute_bucket(type(value))
+        if bucket is None:
+            return
+
+        self.__dict__[bucket][key] = value
+        self.cache.bump('structure')
+
+        if bucket == 'services':
             # store VarService in an additional dict
             if isinstance(value, VarService):
                 self.services_var[key] = value
@@ -317,23 +330,8 @@ class Model:
                     self.services_var_nonseq[key] = value
             elif isinstance(value, PostInitService):
                 self.services_post[key] = value
-        elif isinstance(value, SubsService):
-            self.services_subs[key] = value
-        elif isinstance(value, DeviceFinder):
-            self.services_fnd[key] = value
-        elif isinstance(value, BackRef):
-            self.services_ref[key] = value
-        elif isinstance(value, ExtService):
-            self.services_ext[key] = value
-        elif isinstance(value, (NumRepeat, NumReduce, NumSelect,
-                                FlagValue, RandomService,
-                                SwBlock,
-                                ParamCalc, Replace, ApplyFunc)):
-            self.services_ops[key] = value
-        elif isinstance(value, InitChecker):
-            self.services_icheck[key] = value
-        elif isinstance(value, Block):
-            self.blocks[key] = value
+
+        elif bucket == 'blocks':
             # pull in sub-variables from control blocks
             if value.namespace == 'local':
                 prepend = value.name + '_'
@@ -361,7 +359,8 @@ class Model:
             if not value.tex_name:
                 value.tex_name = key
             if key in self.__dict__:
-                logger.warning(f"{self.class_name}: redefinition of member <{key}>. Likely a modeling error.")
+                logger.warning("%s: redefinition of member <%s>. Likely a modeling error.",
+                               self.class_name, key)
 
     def __setattr__(self, key, value):
         """
@@ -378,13 +377,16 @@ class Model:
         self._check_attribute(key, value)
 
         # store the variable declaration order
+        # `id` is the number of variables registered so far, and is used by
+        # blocks with numerical Jacobians (such as `PIController.j_numeric`)
         if isinstance(value, BaseVar):
-            value.id = len(self._all_vars())  # NOT in use yet
+            value.id = len(self.states) + len(self.algebs) + \
+                len(self.states_ext) + len(self.algebs_ext)
             self.vars_decl_order[key] = value
 
         self._register_attribute(key, value)
 
-        super(Model, self).__setattr__(key, value)
+        super().__setattr__(key, value)
 
     def idx2uid(self, idx):
         """
@@ -397,33 +399,86 @@ class Model:
 
         Returns
         -------
-        list
-            A list containing the unique indices of the devices
+        list or np.ndarray
+            The unique indices of the devices. An int64 array is returned
+            for integer or string arrays of idx, and a list otherwise.
         """
         if idx is None:
             logger.debug("idx2uid returned None for idx None")
             return None
-        if isinstance(idx, (float, int, str, np.integer, np.floating)):
+
+        # exact type checks for the common scalar types go first
+        if type(idx) in _idx_scalar_types or \
+                isinstance(idx, (float, int, str, np.integer, np.floating)):
             return self._one_idx2uid(idx)
-        elif isinstance(idx, Iterable):
-            if len(idx) > 0 and isinstance(idx[0], (list, np.ndarray)):
-                idx = list_flatten(idx)
-            return [self._one_idx2uid(i) if i is not None else None
-                    for i in idx]
-        else:
-            raise NotImplementedError(f'Unknown idx type {type(idx)}')
+
+        if isinstance(idx, np.ndarray) and idx.ndim == 1 and idx.dtype.kind in 'iu' and \
+                self.system is not None and self.system.config.numba == 1:
+            return self._bulk_idx2uid(idx)
+
+        # integer or string arrays cannot contain `None` and convert to an array
+        if isinstance(idx, np.ndarray) and idx.ndim == 1 and idx.dtype.kind in 'iuU':
+            uid = self.uid
+            try:
+                return np.fromiter((uid[i] for i in idx.tolist()), dtype=np.int64, count=len(idx))
+            except KeyError:
+                return [self._one_idx2uid(i) for i in idx]
+
+        try:
+            n_idx = len(idx)
+        except TypeError:
+            raise NotImplementedError(f'Unknown idx type {type(idx)}') from None
+
+        if n_idx > 0 and isinstance(idx[0], (list, np.ndarray)):
+            idx = list_flatten(idx)
+
+        uid = self.uid
+        try:
+            return [uid[i] if i is not None else None for i in idx]
+        except KeyError:
+            # find the missing idx for the error message
+            return [self._one_idx2uid(i) if i is not None else None for i in idx]
 
     def _one_idx2uid(self, idx):
         """
         Helper function for checking if an idx exists and
         converting it to uid.
         """
-
-        if idx not in self.uid:
+        try:
+            return self.uid[idx]
+        except KeyError:
             raise KeyError("<%s>: device not exist with idx=%s." %
-                           (self.class_name, idx))
+                           (self.class_name, idx)) from None
+
+    def _bulk_idx2uid(self, idx):
+        """
+        Convert an integer array of idx to uid with the numba kernel.
 
-        return self.uid[idx]
+        Falls back to the Python path if any `idx` of this model is not an
+        integer or if any element of ``idx`` is not found.
+
+        Returns
+        -------
+        np.ndarray
+            An int64 array of the unique indices
+        """
+        if self._uid_nb is None:
+            self._uid_nb = False
+            if all(isinstance(item, (int, np.integer)) for item in self.uid):
+                uid_nb = numba.typed.Dict.empty(numba.types.int64, numba.types.int64)
+                for key, value in self.uid.items():
+                    uid_nb[key] = value
+                self._uid_nb = uid_nb
+
+        if self._uid_nb is not False:
+            out = np.empty(idx.shape, dtype=np.int64)
+            try:
+                _jit_lookup_uids()(self._uid_nb, idx.astype(np.int64, copy=False), out)
+                return out
+            except KeyError:
+                pass
+
+        return [self._one_idx2uid(i) for i in idx]
 
     def set_backref(self, name, from_idx, to_idx):
         """
@@ -463,15 +518,15 @@ class Model:
 
         """
         uid = self.idx2uid(idx)
-        if isinstance(self.__dict__[src].__dict__[attr], list):
-            if isinstance(uid, Iterable):
-                if not allow_none and (uid is None or None in uid):
-                    raise KeyError('None not allowed in uid/idx. Enable through '
-                                   '`allow_none` and provide a `default` if needed.')
-                return [self.__dict__[src].__dict__[attr][i] if i is not None else default
-                        for i in uid]
+        arr = getattr(self.__dict__[src], attr)
+
+        if isinstance(arr, list) and isinstance(uid, Iterable):
+            if not allow_none and None in uid:
+                raise KeyError('None not allowed in uid/idx. Enable through '
+                               '`allow_none` and provide a `default` if needed.')
+            return [arr[i] if i is not None else default for i in uid]
 
-        return self.__dict__[src].__dict__[attr][uid]
+        return arr[uid]
 
     def set(self, src, idx, attr, value):
         """
@@ -506,7 +561,8 @@ class Model:
         uid = self.idx2uid(idx)
         instance = self.__dict__[src]
 
-        instance.__dict__[attr][uid] = value
+        getattr(instance, attr)[uid] = value
+        self.cache.bump('values')
 
         # update differential equations' time constants stored in `dae.Tf`
 
@@ -558,7 +614,7 @@ class Model:
 
     def get_inputs(self, refresh=False):
         """
-        Get an OrderedDict of the inputs to the numerical function calls.
+        Get a dict of the inputs to the numerical function calls.
 
         Parameters
         ----------
@@ -568,10 +624,16 @@ class Model:
             After initialization, all array assignments are in place.
             To avoid overhead, refresh should not be used after initialization.
 
+            Inputs are also refreshed if ``_input_version`` has been bumped
+            since the last refresh, which is done where arrays are reassigned.
+            Single entries updated by ``_update_input`` only trigger a
+            re-evaluation of operation services and a rebuild of the
+            argument lists.
+
         Returns
         -------
-        OrderedDict
-            The input name and value array pairs in an OrderedDict
+        dict
+            The input name and value array pairs in a dict
 
         Notes
         -----
@@ -579,17 +641,36 @@ class Model:
         There is no need to refresh `dat_t` in this version.
 
         """
-        if len(self._input) == 0 or refresh:
+        if refresh or self._input_stamp != self._input_version:
             self.refresh_inputs()
             self.refresh_inputs_arg()
+            self._input_stamp = self._input_version
+            self._input_args_stale = False
+
+        elif self._input_args_stale:
+            # operation services compute `v` from other services on access
+            for instance in self.services_ops.values():
+                self._input[instance.name] = instance.v
+
+            self.refresh_inputs_arg()
+            self._input_args_stale = False
 
         return self._input
 
+    def _update_input(self, name, value):
+        """
+        Update a single entry of the inputs after its array is reassigned.
+
+        The argument lists are rebuilt at the next ``get_inputs`` call.
+        """
+        self._input[name] = value
+        self._input_args_stale = True
+
     def refresh_inputs(self):
         """
         This is the helper function to refresh inputs.
 
-        The functions collects object references into ``OrderedDict``
+        The functions collects object references into ``dict``
         `self._input` and `self._input_z`.
 
         Returns
@@ -599,23 +680,12 @@ class Model:
         """
         # The order of inputs: `all_params` and then `all_vars`, finally `config`
         # the below sequence should correspond to `self.cache.all_params_names`
-        for instance in self.num_params.values():
-            self._input[instance.name] = instance.v
-
-        for instance in self.services.values():
-            self._input[instance.name] = instance.v
-
-        for instance in self.services_ext.values():
-            self._input[instance.name] = instance.v
-
-        for instance in self.services_ops.values():
-            self._input[instance.name] = instance.v
+        self._input.update({instance.name: instance.v for instance in self.cache.param_inputs})
 
         # discrete flags
-        for instance in self.discrete.values():
-            for name, val in zip(instance.get_names(), instance.get_values()):
-                self._input[name] = val
-                self._input_z[name] = val
+        flags = {name: instance.__dict__[flag] for name, instance, flag in self.cache.discrete_flags}
+        self._input.update(flags)
+        self._input_z.update(flags)
 
         # append all variable values
         for instance in self.cache.all_vars.values():
@@ -668,18 +738,20 @@ class Model:
     def refresh_inputs_arg(self):
         """
         Refresh inputs for each function with individual argument list.
+
+        Arguments are stored in tuples, which are unpacked into calls
+        without being copied.
         """
-        self.f_args = list()
-        self.g_args = list()
         self.j_args = dict()
         self.s_args = dict()
         self.ii_args = dict()
         self.ia_args = dict()
         self.ij_args = dict()
 
-        self.f_args = [self._input[arg] for arg in self.calls.f_args]
-        self.g_args = [self._input[arg] for arg in self.calls.g_args]
-        self.sns_args = [self._input[arg] for arg in self.calls.sns_args]
+        inputs = self._input
+        self.f_args = tuple(inputs[arg] for arg in self.calls.f_args)
+        self.g_args = tuple(inputs[arg] for arg in self.calls.g_args)
+        self.sns_args = tuple(inputs[arg] for arg in self.calls.sns_args)
 
         # each value below is a dict
         mapping = {
@@ -691,9 +763,9 @@ class Model:
         }
 
         for key, val in mapping.items():
-            source = self.calls.__dict__[key]
+            source = getattr(self.calls, key)
             for name in source:
-                val[name] = [self._input[arg] for arg in source[name]]
+                val[name] = tuple(inputs[arg] for arg in source[name])
 
     def l_update_var(self, dae_t, *args, niter=None, err=None, **kwargs):
         """
@@ -705,9 +777,8 @@ class Model:
         -------
         None
         """
-        for instance in self.discrete.values():
-            if instance.has_check_var:
-                instance.check_var(dae_t=dae_t, niter=niter, err=err)
+        for instance in self.cache.discrete_check_var:
+            instance.check_var(dae_t=dae_t, niter=niter, err=err)
 
     def l_check_eq(self, init=False, niter=0, **kwargs):
         """
@@ -721,17 +792,15 @@ class Model:
         None
         """
         if init:
-            for instance in self.discrete.values():
-                if instance.has_check_eq:
-                    instance.check_eq(allow_adjust=self.config.allow_adjust,
-                                      adjust_lower=self.config.adjust_lower,
-                                      adjust_upper=self.config.adjust_upper,
-                                      niter=0
-                                      )
+            for instance in self.cache.discrete_check_eq:
+                instance.check_eq(allow_adjust=self.config.allow_adjust,
+                                  adjust_lower=self.config.adjust_lower,
+                                  adjust_upper=self.config.adjust_upper,
+                                  niter=0
+                                  )
         else:
-            for instance in self.discrete.values():
-                if instance.has_check_eq:
-                    instance.check_eq(niter=niter)
+            for instance in self.cache.discrete_check_eq:
+                instance.check_eq(niter=niter)
 
     def s_update(self):
         """
@@ -745,7 +814,7 @@ class Model:
             if name in self.calls.s:
                 func = self.calls.s[name]
                 if callable(func):
-                    self.get_inputs(refresh=True)
+                    self.get_inputs()
                     # NOTE:
                     # Use new assignment due to possible size change.
                     # Always make a copy and make the RHS a 1-d array
@@ -754,27 +823,29 @@ class Model:
                 else:
                     instance.v = np.array(func, dtype=instance.vtype).ravel()
 
-                # convert to an array if the return of lambda function is a scalar
-                if isinstance(instance.v, (int, float)):
-                    instance.v = np.ones(self.n, dtype=instance.vtype) * instance.v
+                # broadcast to all devices if the return of lambda function is a scalar
+                if len(instance.v) == 1:
+                    instance.v = np.full(self.n, instance.v[0], dtype=instance.vtype)
 
-                elif isinstance(instance.v, np.ndarray) and len(instance.v) == 1:
-                    instance.v = np.ones(self.n, dtype=instance.vtype) * instance.v
+                self._update_input(name, instance.v)
 
             # --- Very Important ---
             # the numerical call of a `ConstService` should only depend on previously
             #   evaluated variables.
             func = instance.v_numeric
             if func is not None and callable(func):
-                kwargs = self.get_inputs(refresh=True)
+                kwargs = self.get_inputs()
                 instance.v = func(**kwargs).copy().astype(instance.vtype)  # performs type conv.
+                self._update_input(name, instance.v)
 
         if self.flags.s_num is True:
-            kwargs = self.get_inputs(refresh=True)
+            kwargs = self.get_inputs()
             self.s_numeric(**kwargs)
+            # `s_numeric` may reassign any service
+            self._input_version += 1
 
         # Block-level `s_numeric` not supported.
-        self.get_inputs(refresh=True)
+        self.get_inputs()
 
     def s_update_var(self):
         """
@@ -829,10 +900,10 @@ class Model:
     def _init_wrap(self, x0, params):
         """
         A wrapper for converting the initialization equations into standard forms g(x) = 0, where x is an array.
+
+        The rows of the reshaped ``x0`` are views of the values of each iterative variable.
         """
-        vars_input = []
-        for i, _ in enumerate(self.cache.iter_vars.values()):
-            vars_input.append(x0[i * self.n: (i + 1) * self.n])
+        vars_input = x0.reshape(len(self.cache.iter_vars), self.n)
 
         ret = np.ravel(self.calls.init_std(vars_input, params))
         return ret
@@ -857,6 +928,9 @@ class Model:
         """
 
         self.triplets.clear_ijv()
+        self._jac_sizes = dict()
+        self._jac_views = dict()
+
         if self.n == 0:  # do not check `self.in_use` here
             return
 
@@ -873,33 +947,96 @@ class Model:
                 instance.j_numeric()
                 self.triplets.merge(instance.triplets)
 
-        # for all combinations of Jacobian names (fx, fxc, gx, gxc, etc.)
+        # for all combinations of Jacobian names (fx, fxc, gx, gxc, etc.),
+        # generated elements are gathered and appended as one triplet
         for j_name in jac_full_names:
-            for idx, val in enumerate(self.calls.vjac[j_name]):
+            rows, cols, sizes = self._gather_jac(j_name)
+            if len(sizes) == 0:
+                continue
 
-                row_name, col_name = self._jac_eq_var_name(j_name, idx)
-                row_idx = self.__dict__[row_name].a
-                col_idx = self.__dict__[col_name].a
+            if j_name[-1] == 'c':
+                value = np.repeat(np.array(self.calls.vjac[j_name], dtype=float), sizes)
+            else:
+                value = np.zeros(sum(sizes))
+                self._jac_sizes[j_name] = sizes
 
-                if len(row_idx) != len(col_idx):
-                    logger.error(f'row {row_name}, row_idx: {row_idx}')
-                    logger.error(f'col {col_name}, col_idx: {col_idx}')
-                    raise ValueError(f'{self.class_name}: non-matching row_idx and col_idx')
+            self.triplets.append_ijv(j_name, rows, cols, value)
 
-                # Note:
-                # n_elem: number of elements in the equation or variable
-                # It does not necessarily equal to the number of devices of the model
-                # For example, `COI.omega_sub.n` depends on the number of generators linked to the COI
-                # and is likely different from `COI.n`
+        self.set_jac_views()
 
-                n_elem = self.__dict__[row_name].n
+    def _gather_jac(self, j_name):
+        """
+        Gather the addresses of the generated elements of a Jacobian type.
 
-                if j_name[-1] == 'c':
-                    value = val * np.ones(n_elem)
-                else:
-                    value = np.zeros(n_elem)
+        Each Jacobian type is gathered independently of the others.
+
+        Returns
+        -------
+        tuple
+            Concatenated row addresses, concatenated column addresses, and
+            the list of the number of addresses of each element.
+        """
+        rows, cols, sizes = [], [], []
+
+        for row_name, col_name in self._jac_eq_var_names(j_name):
+            row_idx = self.__dict__[row_name].a
+            col_idx = self.__dict__[col_name].a
 
-                self.triplets.append_ijv(j_name, row_idx, col_idx, value)
+            if len(row_idx) != len(col_idx):
+                logger.error(f'row {row_name}, row_idx: {row_idx}')
+                logger.error(f'col {col_name}, col_idx: {col_idx}')
+                raise ValueError(f'{self.class_name}: non-matching row_idx and col_idx')
+
+            # Note:
+            # the number of elements in the equation or variable does not necessarily
+            # equal to the number of devices of the model.
+            # For example, `COI.omega_sub.n` depends on the number of generators linked to the COI
+            # and is likely different from `COI.n`
+
+            rows.append(row_idx)
+            cols.append(col_idx)
+            sizes.append(self.__dict__[row_name].n)
+
+        if len(sizes) == 0:
+            return rows, cols, sizes
+
+        return np.concatenate(rows), np.concatenate(cols), sizes
+
+    def set_jac_views(self):
+        """
+        Set the views of each generated variable Jacobian element into the
+        appended triplet values, which are written to in ``j_update``.
+
+        This function needs to be called after de-serializing a System object.
+        """
+        self._jac_views = dict()
+
+        for j_name, sizes in self._jac_sizes.items():
+            # generated elements are the last triplet of each Jacobian name
+            value = self.triplets.vjac[j_name][-1]
+            self._jac_views[j_name] = np.split(value, np.cumsum(sizes)[:-1])
+
+    def _jac_eq_var_names(self, j_name):
+        """
+        Get the equation and variable names for all the elements of a Jacobian type.
+
+        Returns
+        -------
+        list
+            A list of ``(row_name, col_name)`` tuples in the order of ``calls.vjac[j_name]``.
+        """
+        var_names_list = list(self.cache.all_vars.keys())
+        n_states = len(self.cache.states_and_ext)
+
+        # where j_name[0] is the equation name in ("f", "g")
+        eq_names = var_names_list[:n_states] if j_name[0] == 'f' else var_names_list[n_states:]
+
+        try:
+            return [(eq_names[row], var_names_list[col])
+                    for row, col in zip(self.calls.ijac[j_name], self.calls.jjac[j_name])]
+        except IndexError as e:
+            logger.error("Generated code outdated. Run `andes prepare -i` to re-generate.")
+            raise e
 
     def _jac_eq_var_name(self, j_name, idx):
         """
@@ -944,11 +1081,11 @@ class Model:
         """
         if callable(self.calls.f):
             f_ret = self.calls.f(*self.f_args)
-            for i, var in enumerate(self.cache.states_and_ext.values()):
-                if var.e_inplace:
-                    var.e += f_ret[i]
-                else:
-                    var.e[:] = f_ret[i]
+            adders, setters = self.cache.f_dispatch
+            for i, var in adders:
+                var.e += f_ret[i]
+            for i, var in setters:
+                var.e[:] = f_ret[i]
 
         kwargs = self.get_inputs()
         # user-defined numerical calls defined in the model
@@ -966,11 +1103,11 @@ class Model:
         """
         if callable(self.calls.g):
             g_ret = self.calls.g(*self.g_args)
-            for i, var in enumerate(self.cache.algebs_and_ext.values()):
-                if var.e_inplace:
-                    var.e += g_ret[i]
-                else:
-                    var.e[:] = g_ret[i]
+            adders, setters = self.cache.g_dispatch
+            for i, var in adders:
+                var.e += g_ret[i]
+            for i, var in setters:
+                var.e[:] = g_ret[i]
 
         kwargs = self.get_inputs()
         # numerical calls defined in the model
@@ -986,7 +1123,8 @@ class Model:
         """
         Update Jacobian elements.
 
-        Values are stored to ``Model.triplets[jname]``, where ``jname`` is a jacobian name.
+        Values are stored to ``Model.triplets[jname]``, where ``jname`` is a jacobian name,
+        through the views in ``Model._jac_views``.
 
         Returns
         -------
@@ -995,9 +1133,9 @@ class Model:
         for jname, jfunc in self.calls.j.items():
             ret = jfunc(*self.j_args[jname])
 
-            for idx, fun in enumerate(self.calls.vjac[jname]):
+            for idx, value in enumerate(self._jac_views[jname]):
                 try:
-                    self.triplets.vjac[jname][idx][:] = ret[idx]
+                    value[:] = ret[idx]
                 except (ValueError, IndexError, FloatingPointError) as e:
                     row_name, col_name = self._jac_eq_var_name(jname, idx)
                     logger.error('%s: error calculating or storing Jacobian <%s>: j_idx=%s, d%s / d%s',
@@ -1052,23 +1190,16 @@ class Model:
 
     def _all_vars(self):
         """
-        An OrderedDict of States, ExtStates, Algebs, ExtAlgebs
+        A dict of States, ExtStates, Algebs, ExtAlgebs
         """
-        return OrderedDict(list(self.states.items()) +
-                           list(self.states_ext.items()) +
-                           list(self.algebs.items()) +
-                           list(self.algebs_ext.items())
-                           )
+        return {**self.states, **self.states_ext, **self.algebs, **self.algebs_ext}
 
     def _iter_vars(self):
         """
         Variables to be iteratively initialized
         """
-        all_vars = OrderedDict(self.cache.all_vars)
-        for name, instance in self.cache.all_vars.items():
-            if not instance.v_iter:
-                all_vars.pop(name)
-        return all_vars
+        return {name: instance for name, instance in self.cache.all_vars.items()
+                if instance.v_iter}
 
     def _all_vars_names(self):
         out = []
@@ -1078,13 +1209,13 @@ class Model:
 
     def _all_params(self):
         # the service stuff should not be moved to variables.
-        return OrderedDict(list(self.num_params.items()) +
-                           list(self.services.items()) +
-                           list(self.services_ext.items()) +
-                           list(self.services_ops.items()) +
-                           list(self.services_subs.items()) +
-                           list(self.discrete.items())
-                           )
+        return {**self.num_params,
+                **self.services,
+                **self.services_ext,
+                **self.services_ops,
+                **self.services_subs,
+                **self.discrete,
+                }
 
     def _all_params_names(self):
         out = []
@@ -1093,27 +1224,52 @@ class Model:
         return out
 
     def _algebs_and_ext(self):
-        return OrderedDict(list(self.algebs.items()) +
-                           list(self.algebs_ext.items()))
+        return {**self.algebs, **self.algebs_ext}
 
     def _states_and_ext(self):
-        return OrderedDict(list(self.states.items()) +
-                           list(self.states_ext.items()))
+        return {**self.states, **self.states_ext}
 
     def _services_and_ext(self):
-        return OrderedDict(list(self.services.items()) +
-                           list(self.services_ext.items()))
+        return {**self.services, **self.services_ext}
+
+    def _param_inputs(self):
+        """
+        Numerical parameters and services in the order of inputs.
+        """
+        return [*self.num_params.values(), *self.services.values(),
+                *self.services_ext.values(), *self.services_ops.values()]
+
+    def _discrete_check_var(self):
+        return [instance for instance in self.discrete.values() if instance.has_check_var]
+
+    def _discrete_check_eq(self):
+        return [instance for instance in self.discrete.values() if instance.has_check_eq]
+
+    def _discrete_flags(self):
+        """
+        Flattened ``(name, instance, flag)`` tuples of the exported discrete flags.
+        """
+        return [(name, instance, flag)
+                for instance in self.discrete.values()
+                for name, flag in zip(instance.get_names(), instance.export_flags)]
 
     def _vars_ext(self):
-        return OrderedDict(list(self.states_ext.items()) +
-                           list(self.algebs_ext.items()))
+        return {**self.states_ext, **self.algebs_ext}
 
     def _vars_int(self):
-        return OrderedDict(list(self.states.items()) +
-                           list(self.algebs.items()))
+        return {**self.states, **self.algebs}
+
+    def _e_clear_ext(self):
+        """
+        External variables whose equation arrays need to be cleared.
+
+        Only external variables with ``e_str`` have their ``e`` assigned.
+        """
+        return [var for var in self.cache.vars_ext.values()
+                if var.e_str is not None and not var.e_inplace]
 
     def _v_getters(self):
-        out = OrderedDict()
+        out = dict()
         for name, var in self.cache.all_vars.items():
             if var.v_inplace:
                 continue
@@ -1121,7 +1277,7 @@ class Model:
         return out
 
     def _v_adders(self):
-        out = OrderedDict()
+        out = dict()
         for name, var in self.cache.all_vars.items():
             if var.v_inplace is True:
                 continue
@@ -1134,7 +1290,7 @@ class Model:
         return out
 
     def _v_setters(self):
-        out = OrderedDict()
+        out = dict()
         for name, var in self.cache.all_vars.items():
             if var.v_inplace is True:
                 continue
@@ -1146,8 +1302,28 @@ class Model:
             out[name] = var
         return out
 
+    @staticmethod
+    def _split_inplace(variables):
+        """
+        Split ``(position, variable)`` pairs of equations by ``e_inplace``.
+
+        Returns a tuple of two lists: the pairs whose equation values are
+        added in place to the DAE arrays, and the pairs whose values are set
+        to the internal arrays.
+        """
+        adders, setters = [], []
+        for i, var in enumerate(variables.values()):
+            (adders if var.e_inplace else setters).append((i, var))
+        return adders, setters
+
+    def _f_dispatch(self):
+        return self._split_inplace(self.cache.states_and_ext)
+
+    def _g_dispatch(self):
+        return self._split_inplace(self.cache.algebs_and_ext)
+
     def _e_adders(self):
-        out = OrderedDict()
+        out = dict()
         for name, var in self.cache.all_vars.items():
             if var.e_inplace is True:
                 continue
@@ -1160,7 +1336,7 @@ class Model:
         return out
 
     def _e_setters(self):
-        out = OrderedDict()
+        out = dict()
         for name, var in self.cache.all_vars.items():
             if var.e_inplace is True:
                 continue
@@ -1173,18 +1349,10 @@ class Model:
         return out
 
     def _input_vars(self):
-        out = list()
-        for name, var in self.cache.all_vars.items():
-            if var.is_input:
-                out.append(name)
-        return out
+        return [name for name, var in self.cache.all_vars.items() if var.is_input]
 
     def _output_vars(self):
-        out = list()
-        for name, var in self.cache.all_vars.items():
-            if var.is_output:
-                out.append(name)
-        return out
+        return [name for name, var in self.cache.all_vars.items() if var.is_output]
 
     def set_in_use(self):
         """
@@ -1212,12 +1380,16 @@ class Model:
         for instance in self.num_params.values():
             instance.to_array()
 
+        self.pack_params()
+
         for instance in self.cache.services_and_ext.values():
             instance.assign_memory(self.n)
 
         for instance in self.discrete.values():
             instance.list2array(self.n)
 
+        self._input_version += 1
+
     def a_reset(self):
         """
         Reset addresses to empty and reset flags.address to ``False``.
@@ -1227,13 +1399,32 @@ class Model:
         self.flags.address = False
         self.flags.initialized = False
 
+    def alloc_arrays(self):
+        """
+        Allocate ``v`` and ``e`` of internal variables that cannot share
+        memory with DAE arrays.
+
+        The arrays are views into the flat buffers ``_v_buf`` and ``_e_buf``
+        so that they can be cleared at once.
+        """
+        vars_int = self.cache.vars_int.values()
+
+        v_vars = [var for var in vars_int if not var.v_inplace]
+        e_vars = [var for var in vars_int if not var.e_inplace]
+
+        self._v_buf = _alloc_views(v_vars, 'v')
+        self._e_buf = _alloc_views(e_vars, 'e')
+
     def e_clear(self):
         """
         Clear equation value arrays associated with all internal variables.
+
+        Internal equation arrays not sharing memory with DAE are cleared
+        through ``_e_buf``.
         """
-        for instance in self.cache.all_vars.values():
-            if instance.e_inplace:
-                continue
+        self._e_buf[:] = 0
+
+        for instance in self.cache.e_clear_ext:
             instance.e[:] = 0
 
     def v_numeric(self, **kwargs):
@@ -1286,6 +1477,9 @@ class Model:
     def prepare(self, quick=False, pycode_path=None, yapf_pycode=False):
         """
         Symbolic processing and code generation.
+
+        Unless ``quick`` is True, pretty prints are generated on first access
+        through ``Model.syms`` or the documentation in the ``rest`` format.
         """
 
         logger.debug("Generating code for %s", self.class_name)
@@ -1303,7 +1497,7 @@ class Model:
                                   yapf_pycode=yapf_pycode,
                                   )
         if quick is False:
-            self.syms.generate_pretty_print()
+            self.syms.pretty_print_pending = True
 
     def get_md5(self):
         """
@@ -1348,18 +1542,19 @@ class Model:
         """
         Post init checking. Warns if values of `InitChecker` are not True.
         """
-        self.get_inputs(refresh=True)
+        self.get_inputs()
 
         if self.system.config.warn_abnormal:
             for item in self.services_icheck.values():
                 item.check()
 
-    def numba_jitify(self, parallel=False, cache=True, nopython=True):
+    def numba_jitify(self, parallel=False, cache=True, nopython=True, fastmath=False):
         """
         Convert equation residual calls, Jacobian calls, and variable service
         calls into JIT compiled functions.
 
         This function can be enabled by setting ``System.config.numba = 1``.
+        ``fastmath`` is controlled by ``System.config.numba_fastmath``.
         """
 
         if self.system.config.numba != 1:
@@ -1371,6 +1566,7 @@ class Model:
         kwargs = {'parallel': parallel,
                   'cache': cache,
                   'nopython': nopython,
+                  'fastmath': fastmath,
                   }
 
         self.calls.f = to_jit(self.calls.f, **kwargs)
@@ -1399,21 +1595,41 @@ class Model:
             self.mock_refresh_inputs()
         self.refresh_inputs_arg()
 
-        if callable(self.calls.f):
-            self.calls.f(*self.f_args)
-
-        if callable(self.calls.g):
-            self.calls.g(*self.g_args)
-
-        if callable(self.calls.sns):
-            self.calls.sns(*self.sns_args)
+        for name in ('f', 'g', 'sns'):
+            func = getattr(self.calls, name)
+            if callable(func):
+                setattr(self.calls, name,
+                        self._precompile_call(name, func, getattr(self, f'{name}_args')))
 
         for jname, jfunc in self.calls.j.items():
-            jfunc(*self.j_args[jname])
+            self.calls.j[jname] = self._precompile_call(jname, jfunc, self.j_args[jname])
 
         for name, instance in self.services_var_seq.items():
             if instance.v_str is not None:
-                self.calls.s[name](*self.s_args[name])
+                self.calls.s[name] = self._precompile_call(name, self.calls.s[name],
+                                                           self.s_args[name])
+
+    def _precompile_call(self, name, func, args):
+        """
+        Compile a jitted call by calling it with ``args``.
+
+        If numba fails to compile ``func``, a warning is logged and the
+        original Python function is returned so that the model
+        falls back to NumPy evaluation.
+        """
+        try:
+            func(*args)
+        except numba.core.errors.NumbaError as e:
+            py_func = getattr(func, 'py_func', None)
+            if py_func is None:
+                raise e
+
+            logger.warning("%s: numba compilation of <%s> failed. Using the Python version.",
+                           self.class_name, name)
+            logger.debug("%s", e)
+            return py_func
+
+        return func
 
     def __repr__(self):
         dev_text = 'device' if self.n == 1 else 'devices'
@@ -1430,6 +1646,9 @@ class Model:
         3. Custom init
         """
 
+        # external values (such as `ExtService`) are linked before `init`
+        self._input_version += 1
+
         # evaluate `ConstService` and `VarService`
         self.s_update()
         self.s_update_var()
@@ -1448,7 +1667,7 @@ class Model:
                      self.class_name, flag_name, do_init)
 
         if do_init:
-            kwargs = self.get_inputs(refresh=True)
+            kwargs = self.get_inputs()
 
             logger.debug('Initialization sequence:')
             seq_str = ' -> '.join([str(i) for i in self.calls.init_seq])
@@ -1551,9 +1770,12 @@ class Model:
                         _log_init_debug(debug_flag, "%s new values are %s", vv, instance.v)
 
             # call custom variable initializer after generated init
-            kwargs = self.get_inputs(refresh=True)
+            kwargs = self.get_inputs()
             self.v_numeric(**kwargs)
 
+            # custom initializers may reassign arrays
+            self._input_version += 1
+
         # call post initialization checking
         self.post_init_check()
 
@@ -1574,12 +1796,12 @@ class Model:
         Solve iterative initialization for one given device.
         """
 
-        if isinstance(name, str):
-            x0 = inputs[name][pos]
-            name_concat = name
-        else:
-            x0 = np.ravel([inputs[item][pos] for item in name])
-            name_concat = '_'.join(name)
+        names = (name, ) if isinstance(name, str) else name
+        name_concat = '_'.join(names)
+
+        # value arrays of the iterative variables, updated in place
+        arrays = [inputs[item] for item in names]
+        x0 = np.array([arr[pos] for arr in arrays], dtype=float)
 
         rhs = self.calls.ii[name_concat]
         jac = self.calls.ij[name_concat]
@@ -1595,8 +1817,8 @@ class Model:
         while niter < maxiter:
             logger.debug("iteration %s:", niter)
 
-            i_args = [item[pos] for item in ii_args]  # all variables of one device at a time
-            j_args = [item[pos] for item in ij_args]
+            i_args = tuple(item[pos] for item in ii_args)  # all variables of one device at a time
+            j_args = tuple(item[pos] for item in ij_args)
 
             b = np.ravel(rhs(*i_args))
             A = jac(*j_args)
@@ -1609,7 +1831,12 @@ class Model:
                 solved = True
                 break
 
-            inc = - sp.linalg.lu_solve(sp.linalg.lu_factor(A), b)
+            # a single LAPACK `gesv` call; a singular `A` is reported as nan
+            try:
+                inc = - np.linalg.solve(A, b)
+            except np.linalg.LinAlgError:
+                inc = np.full(b.shape, np.nan)
+
             if np.isnan(inc).any():
                 if self.u.v[pos] != 0:
                     logger.debug("%s: nan ignored in iterations for offline device pos = %s",
@@ -1622,15 +1849,12 @@ class Model:
             x0 += inc
             logger.debug("solved x0:\n%s", x0)
 
-            for idx, item in enumerate(name):
-                inputs[item][pos] = x0[idx]
+            for arr, val in zip(arrays, x0):
+                arr[pos] = val
 
             niter += 1
 
-        if solved:
-            for idx, item in enumerate(name):
-                inputs[item][pos] = x0[idx]
-        else:
+        if not solved:
             logger.warning(f"{self.class_name}: iterative initialization failed for {self.idx.v[pos]}.")
 
     def externalize(self):
@@ -1700,6 +1924,7 @@ def to_jit(func: Union[Callable, None],
            parallel: bool = False,
            cache: bool = False,
            nopython: bool = True,
+           fastmath: bool = False,
            ):
     """
     Helper function for converting a function to a numba jit-compiled function.
@@ -1713,11 +1938,103 @@ def to_jit(func: Union[Callable, None],
                          parallel=parallel,
                          cache=cache,
                          nopython=nopython,
+                         fastmath=fastmath,
                          )
 
     return func
 
 
+def _alloc_views(variables, attr):
+    """
+    Allocate a flat zero array and assign its slices to ``attr`` of each
+    variable according to the variable length ``n``.
+
+    Returns
+    -------
+    np.ndarray
+        The flat array
+    """
+    buf = np.zeros(sum(var.n for var in variables))
+
+    start = 0
+    for var in variables:
+        setattr(var, attr, buf[start:start + var.n])
+        start += var.n
+
+    return buf
+
+
+# common types of scalar idx
+_idx_scalar_types = frozenset((int, str, float, np.int32, np.int64, np.float64))
+
+# attribute types and the names of the dicts they are registered to,
+# in the order of precedence
+_attribute_types = ((Algeb, 'algebs'),
+                    (ExtAlgeb, 'algebs_ext'),
+                    (State, 'states'),
+                    (ExtState, 'states_ext'),
+                    (ExtParam, 'params_ext'),
+                    (Discrete, 'discrete'),
+                    (ConstService, 'services'),
+                    (SubsService, 'services_subs'),
+                    (DeviceFinder, 'services_fnd'),
+                    (BackRef, 'services_ref'),
+                    (ExtService, 'services_ext'),
+                    ((NumRepeat, NumReduce, NumSelect,
+                      FlagValue, RandomService,
+                      SwBlock,
+                      ParamCalc, Replace, ApplyFunc), 'services_ops'),
+                    (InitChecker, 'services_icheck'),
+                    (Block, 'blocks'),
+                    )
+
+# cache of attribute type -> dict name (or None if not registered)
+_attribute_buckets = {}
+
+
+def _attribute_bucket(value_type):
+    """
+    Helper function to find the name of the dict that attributes of
+    ``value_type`` are registered to. Results are cached by the exact type.
+    """
+    try:
+        return _attribute_buckets[value_type]
+    except KeyError:
+        pass
+
+    bucket = None
+    for types, name in _attribute_types:
+        if issubclass(value_type, types):
+            bucket = name
+            break
+
+    _attribute_buckets[value_type] = bucket
+    return bucket
+
+
+def _lookup_uids(uid_dict, keys, out):
+    """
+    Kernel for looking up ``keys`` in ``uid_dict`` and storing to ``out``.
+    """
+    for i in range(keys.size):
+        out[i] = uid_dict[keys[i]]
+
+
+_lookup_uids_jit = None
+
+
+def _jit_lookup_uids():
+    """
+    Helper function to compile ``_lookup_uids`` on the first call.
+    """
+    global _lookup_uids_jit
+
+    if _lookup_uids_jit is None:
+        _lookup_uids_jit = numba.njit(_lookup_uids, cache=True)
+
+    return _lookup_uids_jit
+
+
 def _log_init_debug(debug_flag, *args):
     """
     Helper function to log initialization debug message.
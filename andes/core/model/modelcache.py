@@ -8,25 +8,59 @@ class ModelCache:
     Class for caching the return value of callback functions.
 
     Check ``ModelCache.__dict__.keys()`` for fields.
+
+    Callbacks can declare the data they depend on through ``deps``.
+    ``refresh_stale`` skips such callbacks if the versions of their dependencies,
+    bumped by the owner model through ``bump``, have not changed.
+    ``refresh`` always calls the callbacks.
     """
 
+    # cached values are stored in `__dict__`
+    __slots__ = ('_callbacks', '_deps', '_version', '_cached_version', '__dict__')
+
     def __init__(self):
         self._callbacks = {}
+        self._deps = {}
+        self._version = {'structure': 0, 'values': 0}
+        self._cached_version = {}
 
     def __getattr__(self, item):
-        if item == "_callbacks":
-            return self.__getattribute__(item)
+        # `__getattr__` is only invoked when the regular lookup misses,
+        # i.e., when `item` has not been cached in `__dict__`.
+        if item in ("_callbacks", "_deps", "_version", "_cached_version"):
+            raise AttributeError(item)
+
+        try:
+            callback = self._callbacks[item]
+        except KeyError:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{item}'")
+
+        return self._store(item, callback)
 
-        if item not in self.__dict__:
-            if item in self._callbacks:
-                self.__dict__[item] = self._call(item)
+    def _store(self, name, callback):
+        """
+        Call the callback, and store the return value and the dependency versions.
+        """
+        value = callback() if callable(callback) else callback
+        self.__dict__[name] = value
 
-        return self.__getattribute__(item)
+        deps = self._deps.get(name)
+        if deps is not None:
+            self._cached_version[name] = tuple(self._version[d] for d in deps)
+
+        return value
 
     def __getstate__(self):
-        return self.__dict__
+        slots = {name: getattr(self, name) for name in self.__slots__ if name != '__dict__'}
+        return self.__dict__, slots
+
+    def __setstate__(self, state):
+        cached, slots = state
+        self.__dict__.update(cached)
+        for name, value in slots.items():
+            setattr(self, name, value)
 
-    def add_callback(self, name: str, callback):
+    def add_callback(self, name: str, callback, deps=None):
         """
         Add a cache attribute and a callback function for updating the attribute.
 
@@ -36,8 +70,20 @@ class ModelCache:
             name of the cached function return value
         callback : callable
             callback function for updating the cached attribute
+        deps : tuple of str, optional
+            Names of the versions, ``'structure'`` and/or ``'values'``, that the
+            return value depends on. None to always call the callback on refresh.
         """
         self._callbacks[name] = callback
+        self._deps[name] = deps
+        self._cached_version.pop(name, None)
+
+    def bump(self, key):
+        """
+        Increase the version of ``key`` (``'structure'`` or ``'values'``) to mark
+        the dependent cached values as stale.
+        """
+        self._version[key] += 1
 
     def refresh(self, name=None):
         """
@@ -48,33 +94,62 @@ class ModelCache:
         name : str, list, optional
             name or list of cached to refresh, by default None for refreshing all
 
+        """
+        for n in self._names(name):
+            self._store(n, self._callbacks.get(n))
+
+    def refresh_stale(self, name=None):
+        """
+        Refresh the cached values whose dependency versions have changed.
+
+        Callbacks without declared dependencies are always called. In-place
+        writes to parameter values do not bump the versions; use ``refresh``
+        after such writes.
+
+        Parameters
+        ----------
+        name : str, list, optional
+            name or list of cached to refresh, by default None for refreshing all
+        """
+        for n in self._names(name):
+            deps = self._deps.get(n)
+            if deps is not None and n in self.__dict__ and \
+                    self._cached_version.get(n) == tuple(self._version[d] for d in deps):
+                continue
+
+            self._store(n, self._callbacks.get(n))
+
+    def _names(self, name):
+        """
+        Normalize ``name`` of ``refresh`` and ``refresh_stale`` into a sequence of names.
         """
         if name is None:
-            for name in self._callbacks.keys():
-                self.__dict__[name] = self._call(name)
+            return self._callbacks.keys()
         elif isinstance(name, str):
-            self.__dict__[name] = self._call(name)
+            return (name,)
         elif isinstance(name, list):
-            for n in name:
-                self.__dict__[n] = self._call(n)
+            return name
 
-    def _call(self, name):
+        return ()
+
+    def clear(self, name=None):
         """
-        Helper function for calling callback functions.
+        Clear the cached values so that they are recomputed on the next access.
 
         Parameters
         ----------
-        name : str
-            attribute name to be updated
-
-        Returns
-        -------
-        callback result
+        name : str, list, optional
+            name or list of cached to clear, by default None for clearing all
         """
-        if name not in self._callbacks:
-            return None
+        if name is None:
+            names = list(self._callbacks.keys())
+        elif isinstance(name, str):
+            names = (name,)
+        elif isinstance(name, list):
+            names = name
         else:
-            if callable(self._callbacks[name]):
-                return self._callbacks[name]()
-            else:
-                return self._callbacks[name]
+            return
+
+        for n in names:
+            self.__dict__.pop(n, None)
+            self._cached_version.pop(n, None)
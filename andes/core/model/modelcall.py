@@ -2,9 +2,9 @@
 Module for ModelCall.
 """
 
-from collections import OrderedDict
+import numpy as np
 
-from andes.shared import jac_names, jac_types
+from andes.shared import jac_full_names
 
 
 class ModelCall:
@@ -12,6 +12,15 @@ class ModelCall:
     Class for storing generated function calls, Jacobian calls, and arguments.
     """
 
+    __slots__ = ('md5',
+                 'f', 'g', 'j', 's', 'sns',
+                 'f_args', 'g_args', 'j_args', 's_args', 'sns_args',
+                 'ia', 'ii', 'ij', 'ia_args', 'ii_args', 'ij_args',
+                 'ijac', 'jjac', 'vjac', '_ijv_len',
+                 'j_names', 'init_seq', 'need_diag_eps',
+                 'x_latex', 'y_latex', 'f_latex', 'g_latex', 's_latex', 'init_latex',
+                 )
+
     def __init__(self):
         self.md5 = ''
 
@@ -21,57 +30,92 @@ class ModelCall:
         self.f = None
         self.g = None
         self.j = dict()
-        self.s = OrderedDict()
+        self.s = dict()
         self.sns = None
 
         # `f_args` and `g_args` are the arg names
         self.f_args = list()
         self.g_args = list()
         self.j_args = dict()
-        self.s_args = OrderedDict()
+        self.s_args = dict()
         self.sns_args = list()
 
         # when saving to pycode, dict of functions are stored as individual functions.
         # these include `j`, `ia`, `ii`, `ij`, and `s`.
-        self.ia = OrderedDict()
-        self.ii = OrderedDict()
-        self.ij = OrderedDict()
+        self.ia = dict()
+        self.ii = dict()
+        self.ij = dict()
 
-        self.ia_args = OrderedDict()  # assignment initialization
-        self.ii_args = OrderedDict()  # iterative initialization
-        self.ij_args = OrderedDict()
+        self.ia_args = dict()  # assignment initialization
+        self.ii_args = dict()  # iterative initialization
+        self.ij_args = dict()
 
-        self.ijac = OrderedDict()
-        self.jjac = OrderedDict()
-        self.vjac = OrderedDict()
+        self.ijac = dict()
+        self.jjac = dict()
+        self.vjac = dict()
+        self._ijv_len = dict()       # number of used elements in the triplet buffers
 
         self.j_names = list()        # existing jacobian names for this model
         self.init_seq = list()       # initialization sequence
         self.need_diag_eps = list()  # id of algeb variables needing diag_eps
 
-    def clear_ijv(self):
-        for jname in jac_names:
-            for jtype in jac_types:
-                self.ijac[jname + jtype] = list()
-                self.jjac[jname + jtype] = list()
-                self.vjac[jname + jtype] = list()
+    def clear_ijv(self, capacity=64):
+        """
+        Clear the Jacobian triplets.
+
+        Buffers grow geometrically in ``append_ijv`` and are trimmed in ``trim_ijv``.
+        Existing buffers are reused by resetting their lengths.
+        Values are stored in object arrays as they can be numbers or callables.
+        """
+        for name in jac_full_names:
+            ijac = self.ijac.get(name)
+            if not isinstance(ijac, np.ndarray) or len(ijac) == 0:
+                self.ijac[name] = np.empty(capacity, dtype=np.int32)
+                self.jjac[name] = np.empty(capacity, dtype=np.int32)
+                self.vjac[name] = np.empty(capacity, dtype=object)
+
+            self._ijv_len[name] = 0
 
     def append_ijv(self, j_full_name, ii, jj, vv):
-        if not isinstance(ii, int):
-            raise ValueError("i index must be an integer")
-        if not isinstance(jj, int):
-            raise ValueError("j index must be an integer")
-        if not isinstance(vv, (int, float)) and (not callable(vv)):
-            raise ValueError("v must be a number or a callable")
+        # type checks are skipped when running with `python -O`
+        if __debug__:
+            if not isinstance(ii, int):
+                raise ValueError("i index must be an integer")
+            if not isinstance(jj, int):
+                raise ValueError("j index must be an integer")
+            if not isinstance(vv, (int, float)) and (not callable(vv)):
+                raise ValueError("v must be a number or a callable")
+
+        n = self._ijv_len.get(j_full_name, len(self.ijac[j_full_name]))
 
-        self.ijac[j_full_name].append(ii)
-        self.jjac[j_full_name].append(jj)
-        self.vjac[j_full_name].append(vv)
+        if n >= len(self.ijac[j_full_name]):
+            cap = max(2 * n, 64)
+            self.ijac[j_full_name] = np.resize(np.asarray(self.ijac[j_full_name], dtype=np.int32), cap)
+            self.jjac[j_full_name] = np.resize(np.asarray(self.jjac[j_full_name], dtype=np.int32), cap)
+            self.vjac[j_full_name] = np.resize(np.asarray(self.vjac[j_full_name], dtype=object), cap)
+
+        self.ijac[j_full_name][n] = ii
+        self.jjac[j_full_name][n] = jj
+        self.vjac[j_full_name][n] = vv
+        self._ijv_len[j_full_name] = n + 1
+
+    def trim_ijv(self):
+        """
+        Trim the triplet buffers to the number of appended elements.
+        """
+        for name, n in self._ijv_len.items():
+            self.ijac[name] = self.ijac[name][:n].copy()
+            self.jjac[name] = self.jjac[name][:n].copy()
+            self.vjac[name] = self.vjac[name][:n].copy()
+
+        self._ijv_len.clear()
 
     def zip_ijv(self, j_full_name):
         """
         Return a zipped iterator for the rows, cols and vals for the specified matrix name.
         """
-        return zip(self.ijac[j_full_name],
-                   self.jjac[j_full_name],
-                   self.vjac[j_full_name])
+        n = self._ijv_len.get(j_full_name, len(self.ijac[j_full_name]))
+
+        return zip(self.ijac[j_full_name][:n],
+                   self.jjac[j_full_name][:n],
+                   self.vjac[j_full_name][:n])
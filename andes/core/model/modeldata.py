@@ -3,7 +3,6 @@ Module for ModelData.
 """
 
 import logging
-from collections import OrderedDict
 from typing import Iterable, Sized
 
 import numpy as np
@@ -82,22 +81,32 @@ class ModelData:
     """
 
     def __init__(self, *args, three_params=True, **kwargs):
-        self.params = OrderedDict()
-        self.num_params = OrderedDict()
-        self.idx_params = OrderedDict()
-        self.timer_params = OrderedDict()
+        self.params = dict()
+        self.num_params = dict()
+        self.idx_params = dict()
+        self.timer_params = dict()
+        self._find_param_cache = dict()  # cached results of `find_param`
+        self._exported_params = None     # params to export. Built by `as_dict`
         self.n = 0
         self.uid = {}
 
+        # numba typed-dict mirror of `uid` for bulk lookups. Built on demand
+        self._uid_nb = None
+
+        # contiguous storage of numerical parameter values. Allocated by `pack_params`
+        self._v_buffer = None
+        self._v_buffer_names = []
+
         # indexing bases. Most vectorized models only have one base: self.idx
         self.index_bases = []
 
         if not hasattr(self, 'cache'):
             self.cache = ModelCache()
-        self.cache.add_callback('dict', self.as_dict)
-        self.cache.add_callback('df', lambda: self.as_df())
-        self.cache.add_callback('dict_in', lambda: self.as_dict(True))
-        self.cache.add_callback('df_in', lambda: self.as_df(vin=True))
+        data_deps = ('structure', 'values')
+        self.cache.add_callback('dict', self.as_dict, deps=data_deps)
+        self.cache.add_callback('df', lambda: self.as_df(), deps=data_deps)
+        self.cache.add_callback('dict_in', lambda: self.as_dict(True), deps=data_deps)
+        self.cache.add_callback('df_in', lambda: self.as_df(vin=True), deps=data_deps)
 
         if three_params is True:
             self.idx = DataParam(info='unique device idx')
@@ -120,6 +129,9 @@ class ModelData:
                                self.class_name, key)
 
             self.params[key] = value
+            self._find_param_cache.clear()
+            self._exported_params = None
+            self.cache.bump('structure')
 
         if isinstance(value, NumParam):
             self.num_params[key] = value
@@ -130,7 +142,7 @@ class ModelData:
         if isinstance(value, TimerParam):
             self.timer_params[key] = value
 
-        super(ModelData, self).__setattr__(key, value)
+        super().__setattr__(key, value)
 
     def add(self, **kwargs):
         """
@@ -149,6 +161,8 @@ class ModelData:
         """
         idx = kwargs['idx']
         self.uid[idx] = self.n
+        self._uid_nb = None
+        self.cache.bump('values')
         self.n += 1
         if "name" in self.params:
             name = kwargs.get("name")
@@ -164,6 +178,51 @@ class ModelData:
         if len(kwargs) > 0:
             logger.warning("%s: unused data %s", self.class_name, str(kwargs))
 
+    def add_bulk(self, rows):
+        """
+        Add multiple devices to this model.
+
+        Warnings
+        --------
+        This function is not intended to be used directly.
+        Use ``System.add_bulk`` so that the indices can be registered correctly.
+
+        Parameters
+        ----------
+        rows : dict
+            Parameter values of the new devices, keyed by parameter names.
+            ``rows['idx']`` is mandatory, and all the values are sequences of the same length.
+        """
+        rows = dict(rows)
+        idx = list(rows['idx'])
+        n_new = len(idx)
+
+        self.uid.update(zip(idx, range(self.n, self.n + n_new)))
+        self._uid_nb = None
+        self.cache.bump('values')
+        self.n += n_new
+
+        if "name" in self.params:
+            names = rows.get("name")
+            if names is None:
+                names = idx
+            else:
+                names = [i if (name is None) or (not isinstance(name, str) and np.isnan(name)) else name
+                         for i, name in zip(idx, names)]
+            rows["name"] = names
+
+        if "idx" not in self.params:
+            rows.pop("idx")
+
+        for name, instance in self.params.items():
+            values = rows.pop(name, None)
+            if values is None:
+                values = [None] * n_new
+            instance.add_bulk(values)
+
+        if len(rows) > 0:
+            logger.warning("%s: unused data %s", self.class_name, str(rows))
+
     def as_dict(self, vin=False):
         """
         Export all parameters as a dict.
@@ -180,11 +239,12 @@ class ModelData:
         # append 0-indexed `uid`
         out['uid'] = np.arange(self.n)
 
-        for name, instance in self.params.items():
-            # skip non-exported parameters
-            if instance.export is False:
-                continue
+        # skip non-exported parameters
+        if self._exported_params is None:
+            self._exported_params = {name: instance for name, instance in self.params.items()
+                                     if instance.export is not False}
 
+        for name, instance in self._exported_params.items():
             out[name] = instance.v
 
             # use the original input if `vin` is True
@@ -197,6 +257,61 @@ class ModelData:
 
         return out
 
+    def pack_params(self):
+        """
+        Move the values of float-type ``NumParam`` into one contiguous buffer.
+
+        The buffer is Fortran-ordered with one column per parameter, and the
+        ``v`` field of each packed parameter becomes a view of its column.
+        ``ExtParam``, non-exported parameters and parameters with output
+        converters are not packed.
+
+        Must be called after ``NumParam.to_array``.
+        """
+        self.cache.bump('values')
+        self._v_buffer = None
+        self._v_buffer_names = []
+
+        if self.n == 0:
+            return
+
+        names = []
+        for name, instance in self.num_params.items():
+            if type(instance) not in (NumParam, TimerParam):
+                continue
+            if instance.export is False or instance.oconvert is not None:
+                continue
+            if not isinstance(instance.v, np.ndarray) or instance.v.dtype != float or \
+                    instance.v.shape != (self.n, ):
+                continue
+
+            names.append(name)
+
+        if len(names) == 0:
+            return
+
+        buffer = np.empty((self.n, len(names)), dtype=float, order='F')
+        for col, name in enumerate(names):
+            instance = self.num_params[name]
+            buffer[:, col] = instance.v
+            instance.v = buffer[:, col]
+
+        self._v_buffer = buffer
+        self._v_buffer_names = names
+
+    def _v_buffer_valid(self):
+        """
+        Check if all packed parameters still use views of the buffer.
+        """
+        if self._v_buffer is None:
+            return False
+
+        for name in self._v_buffer_names:
+            if self.num_params[name].v.base is not self._v_buffer:
+                return False
+
+        return True
+
     def as_df(self, vin=False):
         """
         Export all parameters as a `pandas.DataFrame` object.
@@ -210,12 +325,29 @@ class ModelData:
             If True, export all parameters from original input (``vin``).
         """
         if vin is False:
+            if self._v_buffer_valid():
+                return self._as_df_packed()
+
             out = pd.DataFrame(self.as_dict()).set_index('uid')
         else:
             out = pd.DataFrame(self.as_dict(vin=True)).set_index('uid')
 
         return out
 
+    def _as_df_packed(self):
+        """
+        Build the DataFrame of ``as_df`` by copying the packed parameter
+        buffer in one block and inserting the remaining columns.
+        """
+        out = pd.DataFrame(self._v_buffer, columns=self._v_buffer_names, copy=True)
+        packed = set(self._v_buffer_names)
+
+        for pos, (name, value) in enumerate(self.as_dict().items()):
+            if name not in packed:
+                out.insert(pos, name, value)
+
+        return out.set_index('uid')
+
     def as_df_local(self):
         """
         Export local variable values and services to a DataFrame.
@@ -239,6 +371,7 @@ class ModelData:
 
         Adding devices are not allowed.
         """
+        self.cache.bump('values')
         if vin is False:
             for name, instance in self.params.items():
                 if instance.export is False:
@@ -259,7 +392,9 @@ class ModelData:
 
     def find_param(self, prop):
         """
-        Find params with the given property and return in an OrderedDict.
+        Find params with the given property and return in a dict.
+
+        Results are cached by ``prop`` and invalidated when a param is added.
 
         Parameters
         ----------
@@ -268,12 +403,13 @@ class ModelData:
 
         Returns
         -------
-        OrderedDict
+        dict
         """
-        out = OrderedDict()
-        for name, instance in self.params.items():
-            if instance.get_property(prop) is True:
-                out[name] = instance
+        out = self._find_param_cache.get(prop)
+        if out is None:
+            out = {name: instance for name, instance in self.params.items()
+                   if instance.get_property(prop) is True}
+            self._find_param_cache[prop] = out
 
         return out
 
@@ -318,15 +454,31 @@ class ModelData:
 
         v_attrs = [self.__dict__[key].v for key in keys]
 
+        if len(v_attrs) == 1:
+            # search by one key without building tuples
+            v_attr = v_attrs[0]
+            rows = v_attr.tolist() if isinstance(v_attr, np.ndarray) else v_attr
+            searches = values[0]
+        else:
+            # stack numerical values into one array and convert rows to
+            # tuples of Python scalars, which are faster to hash
+            if all(isinstance(v, np.ndarray) and v.dtype.kind in 'biuf' for v in v_attrs):
+                rows = list(map(tuple, np.column_stack(v_attrs).tolist()))
+            else:
+                rows = list(zip(*v_attrs))
+            searches = zip(*values)
+
+        # hash table from the key values to the first matching `idx`.
+        # Built in reverse so that the first match overwrites the others.
+        lookup = dict(zip(reversed(rows), reversed(self.idx.v)))
+
         idxes = []
-        for v_search in zip(*values):
-            v_idx = None
-            for pos, v_attr in enumerate(zip(*v_attrs)):
-                if all([i == j for i, j in zip(v_search, v_attr)]):
-                    v_idx = self.idx.v[pos]
-                    break
+        for v_search in searches:
+            v_idx = lookup.get(v_search, None)
             if v_idx is None:
                 if allow_none is False:
+                    if len(v_attrs) == 1:
+                        v_search = (v_search, )
                     raise IndexError(f'{list(keys)}={v_search} not found in {self.class_name}')
                 else:
                     v_idx = default
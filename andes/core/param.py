@@ -116,6 +116,26 @@ class BaseParam:
         else:
             self.v = np.append(self.v, value)
 
+    def add_bulk(self, values):
+        """
+        Add parameter values of multiple new devices to the ``v`` list.
+
+        Parameters
+        ----------
+        values : list
+            Parameter values of the new elements. ``None`` elements use the default.
+
+        See Also
+        --------
+        BaseParam.add : add the value of one new element
+        """
+        values = [self._sanitize(value) for value in values]
+
+        if isinstance(self.v, list):
+            self.v.extend(values)
+        else:
+            self.v = np.append(self.v, values)
+
     def set(self, pos, attr, value):
         """
         Set attributes of the BaseParam class to new values at the given positions.
@@ -299,6 +319,10 @@ class IdxParam(BaseParam):
 
         super().add(value)
 
+    def add_bulk(self, values):
+        for value in values:
+            self.add(value)
+
 
 class NumParam(BaseParam):
     """
@@ -412,9 +436,9 @@ class NumParam(BaseParam):
                  dc_current: bool = False,
                  export: bool = True,
                  ):
-        super(NumParam, self).__init__(default=default, name=name, tex_name=tex_name, info=info,
-                                       unit=unit, export=export, iconvert=iconvert, oconvert=oconvert,
-                                       )
+        super().__init__(default=default, name=name, tex_name=tex_name, info=info,
+                         unit=unit, export=export, iconvert=iconvert, oconvert=oconvert,
+                         )
 
         self.property = dict(non_zero=non_zero,
                              non_positive=non_positive,
@@ -481,7 +505,14 @@ class NumParam(BaseParam):
                                self.owner.class_name, self.name, self.default)
                 value = self.default
 
-        super(NumParam, self).add(value)
+        super().add(value)
+
+    def add_bulk(self, values):
+        """
+        Add values of multiple new devices, with the checks in ``add`` applied to each value.
+        """
+        for value in values:
+            self.add(value)
 
     def to_array(self):
         """
@@ -592,8 +623,8 @@ class TimerParam(NumParam):
                  non_zero: bool = False,
                  mandatory: bool = False,
                  export: bool = True):
-        super(TimerParam, self).__init__(default=default, name=name, tex_name=tex_name, info=info, unit=unit,
-                                         mandatory=mandatory, non_zero=non_zero, export=export)
+        super().__init__(default=default, name=name, tex_name=tex_name, info=info, unit=unit,
+                         mandatory=mandatory, non_zero=non_zero, export=export)
         self.default = -1  # default to -1 to deactivate
         self.callback = callback  # provide a callback function that takes an array of booleans
 
@@ -667,6 +698,12 @@ class ExtParam(NumParam):
         """
         pass
 
+    def add_bulk(self, values):
+        """
+        ExtParam has an empty `add_bulk` method.
+        """
+        pass
+
     def restore(self):
         """
         ExtParam has an empty `restore` method
@@ -1572,7 +1572,7 @@ class RandomService(BaseService):
     """
 
     def __init__(self, func=np.random.rand, **kwargs):
-        super(RandomService, self).__init__(**kwargs)
+        super().__init__(**kwargs)
         self.func = func
 
     @property
@@ -20,6 +20,62 @@ logger = logging.getLogger(__name__)
 select_args_add = ["__zeros", "__ones", "__falses", "__trues"]
 
 
+def _select_args(src):
+    """
+    Get the additional arguments in ``select_args_add`` that are used by
+    ``select`` in the source code of a generated function.
+    """
+    if 'select' not in src:
+        return []
+
+    return [name for name in select_args_add if name in src]
+
+
+# modules for lambdify, including the custom functions
+lambdify_modules = [{'Indicator': lambda x: x,
+                     'imag': np.imag,
+                     'real': np.real,
+                     'safe_div': safe_div,
+                     },
+                    'numpy']
+
+_lambdify_cache = dict()
+
+
+def _lambdify(args, expr, cse=False):
+    """
+    Lambdify ``expr`` with ``args`` using ``lambdify_modules``.
+
+    Identical expressions recur across variables and models. Generated
+    functions are cached by the argument names and the expression structure.
+    """
+    key = (tuple(str(item) for item in args), sp.srepr(expr), cse)
+
+    func = _lambdify_cache.get(key)
+    if func is None:
+        kwargs = {'cse': True} if cse else {}
+        func = sp.lambdify(args, expr, modules=lambdify_modules, **kwargs)
+        _lambdify_cache[key] = func
+
+    return func
+
+
+def _pretty_print_attr(name):
+    """
+    Create a property for the pretty print attribute ``name``,
+    which is generated on first access if pending.
+    """
+    def fget(self):
+        if self.pretty_print_pending:
+            self.generate_pretty_print()
+        return self.__dict__['_' + name]
+
+    def fset(self, value):
+        self.__dict__['_' + name] = value
+
+    return property(fget, fset)
+
+
 # the line below caches Piecewise instances
 sp.OldPiecewise = sp.Piecewise
 
@@ -52,16 +108,25 @@ class SymProcessor:
         config flags. It has the same variables as what ``get_inputs()`` returns.
     vars_dict : OrderedDict
         variable-only symbols, which are useful when getting the Jacobian matrices.
+    pretty_print_pending : bool
+        True if pretty prints are to be generated on first access.
 
     """
 
+    xy = _pretty_print_attr('xy')
+    f = _pretty_print_attr('f')
+    g = _pretty_print_attr('g')
+    s = _pretty_print_attr('s')
+    df = _pretty_print_attr('df')
+    dg = _pretty_print_attr('dg')
+
     def __init__(self, parent):
 
         self.parent = parent
         # symbols that are input to lambda functions
         # including parameters, variables, services, configs, and scalars (dae_t, sys_f, sys_mva)
         self.inputs_dict = OrderedDict()
-        self.lambdify_func = [dict(), 'numpy']
+        self.lambdify_func = lambdify_modules
 
         self.vars_dict = OrderedDict()
         self.vars_int_dict = OrderedDict()   # internal variables only
@@ -75,6 +140,7 @@ class SymProcessor:
         self.j_calls = dict()  # Jacobian name -> symbolic expressions
 
         # pretty print of variables
+        self.pretty_print_pending = False
         self.xy = list()  # variables in the order of states, algebs
         self.f, self.g, self.s = list(), list(), list()
         self.df, self.dg = None, None
@@ -145,12 +211,6 @@ class SymProcessor:
         self.inputs_dict['sys_f'] = sp.Symbol('sys_f')
         self.inputs_dict['sys_mva'] = sp.Symbol('sys_mva')
 
-        # custom functions
-        self.lambdify_func[0]['Indicator'] = lambda x: x
-        self.lambdify_func[0]['imag'] = np.imag
-        self.lambdify_func[0]['real'] = np.real
-        self.lambdify_func[0]['safe_div'] = safe_div
-
         self.vars_list = list(self.vars_dict.values())  # useful for ``.jacobian()``
 
     def _check_expr_symbols(self, expr):
@@ -230,14 +290,12 @@ class SymProcessor:
             eargs.sort()
 
             if len(elist) == 0 or not any(elist):  # `any`, not `all`
-                self.calls.__dict__[ename] = None
+                setattr(self.calls, ename, None)
             else:
-                self.calls.__dict__[ename] = sp.lambdify(sym_args, tuple(elist),
-                                                         modules=self.lambdify_func)
+                setattr(self.calls, ename, _lambdify(sym_args, tuple(elist)))
 
                 # manually append additional arguments for select.
-                if 'select' in inspect.getsource(self.calls.__dict__[ename]):
-                    eargs.extend(select_args_add)
+                eargs.extend(_select_args(inspect.getsource(getattr(self.calls, ename))))
 
         # convert to SymPy matrices
         self.f_matrix = sp.Matrix(self.f_list)
@@ -282,18 +340,16 @@ class SymProcessor:
 
             if instance.sequential is True:
                 s_args[name] = args_expr
-                s_calls[name] = sp.lambdify(s_args[name], s_syms[name], modules=self.lambdify_func)
-                if 'select' in inspect.getsource(s_calls[name]):
-                    s_args[name].extend(select_args_add)
+                s_calls[name] = _lambdify(s_args[name], s_syms[name])
+                s_args[name].extend(_select_args(inspect.getsource(s_calls[name])))
             else:
                 s_calls_nonseq.append(expr)
                 s_calls_nonseq_args.extend(args_expr)
 
         if len(s_calls_nonseq) > 0:
             sns_args = sorted(list(set(s_calls_nonseq_args)))
-            sns_calls = sp.lambdify(sns_args, tuple(s_calls_nonseq), modules=self.lambdify_func)
-            if 'select' in inspect.getsource(sns_calls):
-                sns_args.extend(select_args_add)
+            sns_calls = _lambdify(sns_args, tuple(s_calls_nonseq))
+            sns_args.extend(_select_args(inspect.getsource(sns_calls)))
 
         self.s_syms = s_syms
         self.calls.s = s_calls
@@ -314,6 +370,9 @@ class SymProcessor:
             col -> self.calls._jgy
             val -> self.calls._vgy
 
+        Elements that evaluate to numbers are stored to the constant Jacobians (e.g., ``gyc``)
+        instead, so that they are not evaluated in every Jacobian update.
+
         """
         logger.debug('- Generating Jacobians for %s', self.class_name)
 
@@ -337,8 +396,16 @@ class SymProcessor:
         algebs_and_ext_list = list(self.cache.algebs_and_ext)
         states_and_ext_list = list(self.cache.states_and_ext)
 
+        # positions of names in the lists above
+        v_idx_map = {name: i for i, name in enumerate(vars_syms_list)}
+        e_idx_maps = {'f': {name: i for i, name in enumerate(states_and_ext_list)},
+                      'g': {name: i for i, name in enumerate(algebs_and_ext_list)},
+                      }
+
+        all_vars = self.cache.all_vars
+
         fg_sparse = [self.df_sparse, self.dg_sparse]
-        j_args = defaultdict(list)   # argument list for each jacobian call
+        j_args = defaultdict(dict)   # unique arguments (as keys) for each jacobian call
         j_calls = defaultdict(list)  # jacobian functions (one for each type)
 
         for idx, eq_sparse in enumerate(fg_sparse):
@@ -350,19 +417,22 @@ class SymProcessor:
                     eq_name = algebs_and_ext_list[e_idx]
 
                 var_name = vars_syms_list[v_idx]
-                eqn = self.cache.all_vars[eq_name]    # `BaseVar` that corr. to the equation
-                var = self.cache.all_vars[var_name]   # `BaseVar` that corr. to the variable
+                eqn = all_vars[eq_name]    # `BaseVar` that corr. to the equation
+                var = all_vars[var_name]   # `BaseVar` that corr. to the variable
                 jname = f'{eqn.e_code}{var.v_code}'
 
+                # numerical elements are stored as constant Jacobians,
+                # whose values are set once in the sparsity pattern
+                if e_symbolic.is_Number:
+                    self.calls.append_ijv(f'{jname}c', e_idx, v_idx, float(e_symbolic))
+                    continue
+
                 # jac calls with all arguments and stored individually
                 # the `0` value will be used for building the Jacobian sparsity pattern
                 self.calls.append_ijv(jname, e_idx, v_idx, 0)
 
                 # collect unique arguments for jac calls
-                free_syms = self._check_expr_symbols(e_symbolic)
-                for fs in free_syms:
-                    if fs not in j_args[jname]:
-                        j_args[jname].append(fs)
+                j_args[jname].update(dict.fromkeys(self._check_expr_symbols(e_symbolic)))
                 j_calls[jname].append(e_symbolic)
 
         self.j_args = j_args
@@ -370,23 +440,23 @@ class SymProcessor:
 
         for jname in j_calls:
             # sort for stable argument list
-            j_args[jname].sort(key=lambda s: s.name)
+            j_args[jname] = sorted(j_args[jname], key=lambda s: s.name)
 
             self.calls.j_args[jname] = [str(i) for i in j_args[jname]]
             # workaround for SymPy 1.10 to generate tuples with one element. See
             # https://github.com/sympy/sympy/issues/23224
-            self.calls.j[jname] = sp.lambdify(j_args[jname], Tuple(*j_calls[jname]), modules=self.lambdify_func)
+            # common subexpressions are shared across all entries of the same Jacobian
+            self.calls.j[jname] = _lambdify(j_args[jname], Tuple(*j_calls[jname]), cse=True)
 
             # manually append additional arguments for select
-            if 'select' in inspect.getsource(self.calls.j[jname]):
-                self.calls.j_args[jname].extend(select_args_add)
+            self.calls.j_args[jname].extend(_select_args(inspect.getsource(self.calls.j[jname])))
 
         self.calls.j_names = list(j_calls.keys())
 
         # The for-loop below is intended to add an epsilon small value to the diagonal of `gy`.
         # The user should take care of the algebraic equations by using `diag_eps` in `Algeb` definition
 
-        for var in self.parent.cache.all_vars.values():
+        for var in all_vars.values():
             if var.diag_eps == 0.0:
                 continue
             elif var.diag_eps is True:
@@ -400,37 +470,40 @@ class SymProcessor:
             else:
                 eps = var.diag_eps
 
-            if var.e_code == 'g':
-                eq_list = algebs_and_ext_list
-            else:
-                eq_list = states_and_ext_list
-
-            e_idx = eq_list.index(var.name)
-            v_idx = vars_syms_list.index(var.name)
+            e_idx = e_idx_maps[var.e_code][var.name]
+            v_idx = v_idx_map[var.name]
 
             self.calls.append_ijv(f'{var.e_code}{var.v_code}c', e_idx, v_idx, eps)
             self.calls.need_diag_eps.append(var.name)
 
+        self.calls.trim_ijv()
+
     def generate_pretty_print(self):
         """
         Generate pretty print variables and equations.
         """
         logger.debug("- Generating pretty prints for %s", self.class_name)
+        self.pretty_print_pending = False
 
         # equation symbols for pretty printing
         self.f, self.g = sp.Matrix([]), sp.Matrix([])
 
+        # `xreplace` swaps exact symbols in one tree traversal, which is much faster than
+        # the pattern matching in `subs`. It does not sympify keys, so convert the str ones.
+        tex_names = {sp.Symbol(key) if isinstance(key, str) else key: val
+                     for key, val in self.tex_names.items()}
+
         try:
-            self.xy = sp.Matrix(list(self.vars_dict.values())).subs(self.tex_names)
+            self.xy = sp.Matrix(list(self.vars_dict.values())).xreplace(tex_names)
         except TypeError as e:
             logger.error("Error while substituting tex_name for variables.")
             logger.error("Variable names might have conflicts with SymPy functions.")
             raise e
 
         # get pretty printing equations by substituting symbols
-        self.f = self.f_matrix.subs(self.tex_names)
-        self.g = self.g_matrix.subs(self.tex_names)
-        self.s = [item.subs(self.tex_names) for item in self.s_syms.values()]
+        self.f = self.f_matrix.xreplace(tex_names)
+        self.g = self.g_matrix.xreplace(tex_names)
+        self.s = [item.xreplace(tex_names) for item in self.s_syms.values()]
 
         # store latex strings
         nx = len(self.f)
@@ -442,8 +515,8 @@ class SymProcessor:
         self.calls.g_latex = [sp.latex(item) for item in self.g]
         self.calls.s_latex = [sp.latex(item) for item in self.s]
 
-        self.df = self.df_sparse.subs(self.tex_names)
-        self.dg = self.dg_sparse.subs(self.tex_names)
+        self.df = self.df_sparse.xreplace(tex_names)
+        self.dg = self.dg_sparse.xreplace(tex_names)
 
         # store init latex strings
         init_latex = OrderedDict()
@@ -452,9 +525,9 @@ class SymProcessor:
                 init_latex[name] = ''
             else:
                 if instance.v_str is not None:
-                    init_latex[name] = sp.latex(self.v_str_syms[name].subs(self.tex_names))
+                    init_latex[name] = sp.latex(self.v_str_syms[name].xreplace(tex_names))
                 if instance.v_iter is not None:
-                    init_latex[name] = sp.latex(self.v_iter_syms[name].subs(self.tex_names))
+                    init_latex[name] = sp.latex(self.v_iter_syms[name].xreplace(tex_names))
 
         self.calls.init_latex = init_latex
 
@@ -519,7 +592,14 @@ from andes.thirdparty.npfunc import *                               # NOQA
 
         # variables
         for name in dilled_vars:
-            out.append(f'{name} = ' + pprint.pformat(self.calls.__dict__[name]) + "\n")
+            value = getattr(self.calls, name)
+            if name in ('ijac', 'jjac', 'vjac'):
+                value = {key: np.asarray(val).tolist() for key, val in value.items()}
+
+            # write as `OrderedDict` to keep the insertion order in pycode
+            if name in ('s_args', 'ia_args', 'ii_args', 'ij_args', 'ijac', 'jjac', 'vjac'):
+                value = OrderedDict(value)
+            out.append(f'{name} = ' + pprint.pformat(value) + "\n")
 
         out_str = '\n'.join(out)
 
@@ -547,7 +627,7 @@ from andes.thirdparty.npfunc import *                               # NOQA
         This function performs these tasks:
 
         1. rename ``_lambdifygenerated`` to the given ``func_name``.
-        2. append four arguments if ``select`` is used to pass numba
+        2. append the arguments used by ``select`` to pass numba
            compilation.
         3. remove ``Indicator`` for wrappers of logic expressions.
 
@@ -567,8 +647,9 @@ from andes.thirdparty.npfunc import *                               # NOQA
         src = src.replace("Indicator", "")
 
         # append additional arguments for select
-        if 'select' in src:
-            right_parenthesis = ", " + ', '.join(select_args_add) + "):"
+        select_args = _select_args(src)
+        if len(select_args) > 0:
+            right_parenthesis = ", " + ', '.join(select_args) + "):"
             src = src.replace("):", right_parenthesis)
 
         if yapf_pycode:
@@ -697,6 +778,9 @@ from andes.thirdparty.npfunc import *                               # NOQA
     def lambdify_init(self):
         """
         Convert equations and Jacobians to lambda functions.
+
+        Iterative equations and their Jacobians are lambdified with common
+        subexpression elimination, since they are evaluated in every Newton step.
         """
 
         init_a = OrderedDict()
@@ -709,23 +793,20 @@ from andes.thirdparty.npfunc import *                               # NOQA
         for name, expr in self.init_asn.items():
             fs = self._check_expr_symbols(expr)
             ia_args[name] = [str(i) for i in fs]
-            init_a[name] = sp.lambdify(ia_args[name], expr, modules=self.lambdify_func)
-            if 'select' in inspect.getsource(init_a[name]):
-                ia_args[name].extend(select_args_add)
+            init_a[name] = _lambdify(ia_args[name], expr)
+            ia_args[name].extend(_select_args(inspect.getsource(init_a[name])))
 
         for name, expr in self.init_itn.items():
             fs = self._check_expr_symbols(expr)
             ii_args[name] = [str(i) for i in fs]
-            init_i[name] = sp.lambdify(ii_args[name], expr, modules=self.lambdify_func)
-            if 'select' in inspect.getsource(init_i[name]):
-                ii_args[name].extend(select_args_add)
+            init_i[name] = _lambdify(ii_args[name], expr, cse=True)
+            ii_args[name].extend(_select_args(inspect.getsource(init_i[name])))
 
             jexpr = self.init_jac[name]
             fs = self._check_expr_symbols(jexpr)
             ij_args[name] = [str(i) for i in fs]
-            init_j[name] = sp.lambdify(ij_args[name], jexpr, modules=self.lambdify_func)
-            if 'select' in inspect.getsource(init_j[name]):
-                ij_args[name].extend(select_args_add)
+            init_j[name] = _lambdify(ij_args[name], jexpr, cse=True)
+            ij_args[name].extend(_select_args(inspect.getsource(init_j[name])))
 
         self.calls.ia = init_a
         self.calls.ii = init_i
@@ -5,14 +5,14 @@ Author: Josep Fanals (@JosepFanals)
 """
 
 import logging
+import sys
 from functools import wraps
 
 import numpy as np
-import matplotlib
 
 from andes.shared import GridCal_Engine as gc
+from andes.shared import mpl
 
-matplotlib.use('agg')
 logger = logging.getLogger(__name__)
 
 
@@ -23,6 +23,10 @@ def require_gridcal(f):
 
     @wraps(f)
     def wrapper(*args, **kwds):
+        # select a non-interactive backend before GridCal imports matplotlib
+        if 'GridCal' not in sys.modules:
+            mpl.use('agg')
+
         try:
             getattr(gc, '__name__')
         except AttributeError as exc:
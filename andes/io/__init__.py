@@ -220,3 +220,30 @@ def read_file_like(infile: Union[str, io.IOBase]):
         f.close()
 
     return lines_list
+
+
+def iter_file_like(infile: Union[str, io.IOBase]):
+    """
+    Iterate over the lines of a file-like object without line endings.
+
+    Unlike ``read_file_like``, lines are read on demand instead of loading
+    the whole file into memory. For file paths, the encoding is detected
+    incrementally and the detection stops as soon as it is confident.
+    """
+
+    if isinstance(infile, str):
+        detector = chardet.UniversalDetector()
+        with open(infile, 'rb') as fb:
+            for chunk in iter(lambda: fb.read(65536), b''):
+                detector.feed(chunk)
+                if detector.done:
+                    break
+        charset = detector.close()
+        logger.debug("Detected raw file encoding: %s", charset)
+
+        with open(infile, 'r', encoding=charset['encoding']) as f:
+            for line in f:
+                yield line.rstrip('\r\n')
+    else:
+        for line in infile:
+            yield line.rstrip('\r\n')
@@ -94,7 +94,6 @@ def read(system, infile: Union[str, io.IOBase]):
         f.close()
 
     for name, dct in json_in.items():
-        for row in dct:
-            system.add(name, row)
+        system.add_bulk(name, dct)
 
     return system
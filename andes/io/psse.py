@@ -4,17 +4,19 @@ PSS/E file parser.
 Include a RAW parser and a DYR parser.
 """
 
+import copy
 import logging
-import re
 import os
 import yaml
+from functools import lru_cache
+from itertools import islice
 
 import andes.io
 
 from andes.core.symprocessor import resolve_deps
 from andes.models import file_classes
 from andes.utils.func import list_flatten
-from andes.shared import deg2rad, pd
+from andes.shared import deg2rad, np, pd
 from andes.utils.misc import to_number
 from collections import defaultdict
 
@@ -25,12 +27,13 @@ def testlines(infile):
     """
     Check the raw file for frequency base.
     """
-    lines_list = andes.io.read_file_like(infile)
+    lines = andes.io.iter_file_like(infile)
+    first = next(lines, None)
+    lines.close()
 
-    if len(lines_list) == 0:
+    if first is None:
         return False
 
-    first = lines_list[0]
     first = first.strip().split('/')
     first = first[0].split(',')
 
@@ -48,20 +51,22 @@ def testlines(infile):
         return False
 
 
+# number of lines of each device in the blocks of the RAW file
+_block_line_counts = (1, 1, 1, 1, 1, 4, 1, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 0)
+
+
 def get_block_lines(b, mdata):
     """
     Return the number of lines based on the block index in the RAW file.
     """
 
-    line_counts = [1, 1, 1, 1, 1, 4, 1, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 0]
-
     if b == 5:  # for transformer
         if mdata[0][2] == 0:  # two-winding transformer
             return 4
         else:  # three-winding transformer
             return 5
 
-    return line_counts[b]
+    return _block_line_counts[b]
 
 
 def read(system, file):
@@ -74,8 +79,6 @@ def read(system, file):
         'twotermdc', 'vscdc', 'impedcorr', 'mtdc', 'msline', 'zone',
         'interarea', 'owner', 'facts', 'swshunt', 'gne', 'Q'
     ]
-    rawd = re.compile(r'rawd\d\d')
-
     ret = True
     block_idx = 0  # current block index
     mva = 100
@@ -84,54 +87,57 @@ def read(system, file):
     for item in blocks:
         raw[item] = []
 
-    data = []
     mdata = []  # multi-line data
     dev_line = 0  # line counter for multi-line models
 
-    # read file into `line_list`
-    line_list = andes.io.read_file_like(file)
+    # read the lines of `file` on demand
+    lines = andes.io.iter_file_like(file)
+
+    # cell strings such as flags, zeros and owners repeat heavily;
+    # memoize their conversions for this file
+    to_num = lru_cache(maxsize=None)(to_number)
+
+    # get basemva and nominal frequency from the first line
+    line = next(lines).strip()
+    data = line.split('/')[0]
+    data = data.split(',')
+
+    mva = float(data[1])
+    system.config.mva = mva
+    try:
+        system.config.freq = float(data[5])
+    except IndexError:
+        logger.warning('System frequency is set to 60 Hz.\n'
+                       'Consider using a higher version PSS/E raw file.')
+        system.config.freq = 60.0
+
+    # get raw file version
+    version = 0
+    if len(data) >= 3:
+        version = int(data[2])
+    else:
+        pos = line.find('rawd')
+        if pos >= 0 and line[pos + 4:pos + 6].isdigit():
+            version = int(line[pos + 4:pos + 6])  # NOQA
 
-    # parse file into `raw` with to_number conversions
-    for num, line in enumerate(line_list):
+    # store the case info lines
+    for line in islice(lines, 2):
         line = line.strip()
-        # get basemva and nominal frequency
-        if num == 0:
-            data = line.split('/')[0]
-            data = data.split(',')
-
-            mva = float(data[1])
-            system.config.mva = mva
-            try:
-                system.config.freq = float(data[5])
-            except IndexError:
-                logger.warning('System frequency is set to 60 Hz.\n'
-                               'Consider using a higher version PSS/E raw file.')
-                system.config.freq = 60.0
-
-            # get raw file version
-            version = 0
-            if len(data) >= 3:
-                version = int(data[2])
-            else:
-                if rawd.search(line):
-                    version = int(rawd.search(line).group(0).strip('rawd'))  # NOQA
+        if len(line) > 0:
+            logger.info("  " + line)
 
+    # parse device data into `raw` with to_number conversions
+    for line in lines:
+        line = line.strip()
+        if not line:
             continue
-
-        elif num == 1 or num == 2:  # store the case info line
-            if len(line) > 0:
-                logger.info("  " + line)
+        elif line.startswith('Q'):  # end of file
+            break
+        elif line == '0' or line.startswith(('0 ', '0/')):  # end of block
+            block_idx += 1
             continue
-        elif num >= 3:
-            if line[0:2] == '0 ' or line[0:3] == ' 0 ':  # end of block
-                block_idx += 1
-                continue
-            elif line[0] == 'Q':  # end of file
-                break
-            data = line.split(',')
 
-        data = [to_number(item) for item in data]
-        mdata.append(data)
+        mdata.append(list(map(to_num, line.split(','))))
         dev_line += 1
 
         block_lines = get_block_lines(block_idx, mdata)
@@ -142,6 +148,8 @@ def read(system, file):
             mdata = []
             dev_line = 0
 
+    lines.close()
+
     # add device elements to system
     bus_params, bus_idx_list, sw = _parse_bus_v33(raw, system)
     max_bus = max(bus_idx_list)
@@ -161,12 +169,10 @@ def _read_dyr_dict(file):
     """
     Parse dyr file into a dict where keys are model names and values are dataframes.
     """
-    input_list = andes.io.read_file_like(file)
-
     # concatenate multi-line device data
     input_concat_dict = defaultdict(list)
     multi_line = list()
-    for line in input_list:
+    for line in andes.io.iter_file_like(file):
         if line == '':
             continue
         if '/' not in line:
@@ -187,13 +193,37 @@ def _read_dyr_dict(file):
     # construct pandas dataframe for all models
     dyr_dict = dict()   # input data from dyr file
 
+    to_num = lru_cache(maxsize=None)(to_number)
     for psse_model, all_rows in input_concat_dict.items():
-        dev_params_num = [([to_number(cell) for cell in row.split()]) for row in all_rows]
+        dev_params_num = [list(map(to_num, row.split())) for row in all_rows]
         dyr_dict[psse_model] = pd.DataFrame(dev_params_num)
 
     return dyr_dict
 
 
+@lru_cache(maxsize=None)
+def _load_dyr_yaml():
+    """
+    Load the PSS/E DYR conversion rules in ``psse-dyr.yaml``.
+
+    The file is parsed once per process. Callers that modify the rules
+    shall work on a copy.
+    """
+    dirname = os.path.dirname(__file__)
+    with open(f'{dirname}/psse-dyr.yaml', 'r') as f:
+        return yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+
+@lru_cache(maxsize=None)
+def _eval_dyr_func(func):
+    """
+    Evaluate a conversion function string in ``psse-dyr.yaml``.
+
+    Each distinct string is compiled once per process.
+    """
+    return eval(func)
+
+
 def read_add(system, file):
     """
     Read an addition PSS/E dyr file.
@@ -214,9 +244,7 @@ def read_add(system, file):
     system.dyr_dict = dyr_dict
 
     # read yaml and set header for each pss/e model
-    dirname = os.path.dirname(__file__)
-    with open(f'{dirname}/psse-dyr.yaml', 'r') as f:
-        dyr_yaml = yaml.full_load(f)
+    dyr_yaml = copy.deepcopy(_load_dyr_yaml())
 
     sorted_models = sort_psse_models(dyr_yaml, system)
 
@@ -303,7 +331,7 @@ def read_add(system, file):
                     out_dict[out_key] = find[expr]
                 elif ';' in expr:
                     args, func = expr.split(';')
-                    func = eval(func)
+                    func = _eval_dyr_func(func)
                     args = args.split(',')
                     # support local and external model parameters
                     argv = list()
@@ -318,34 +346,37 @@ def read_add(system, file):
                     out_dict[output_keys[idx]] = dyr_dict[psse_model][expr]
 
             df = pd.DataFrame.from_dict(out_dict)
-            for row in df.to_dict(orient='records'):
-                system.add(dest, row)
+            system.add_bulk(dest, df.to_dict(orient='records'))
 
         system.link_ext_param(system.__dict__[dest])
 
     return True
 
 
+def _bus_vn_map(system):
+    """
+    Return a dict mapping the idx of the added buses to their nominal voltages.
+    """
+    return dict(zip(system.Bus.idx.v, system.Bus.Vn.v))
+
+
 def _parse_bus_v33(raw, system):
     # version 32:
     #   0,   1,      2,     3,    4,   5,  6,   7,  8
     #   ID, NAME, BasekV, Type, Area Zone Owner Vm, Va
     #
     out = defaultdict(list)
-    bus_idx_list = list()
-    sw = dict()
+    bus_idx_list = [data[0] for data in raw['bus']]
 
-    for data in raw['bus']:
+    # convert all the angles at once
+    a0 = np.fromiter((data[8] for data in raw['bus']), dtype=float,
+                     count=len(raw['bus'])) * deg2rad
 
-        idx = data[0]
-        bus_idx_list.append(idx)
-        ty = data[3]
-        a0 = data[8] * deg2rad
+    sw = {idx: a for idx, data, a in zip(bus_idx_list, raw['bus'], a0) if data[3] == 3}
 
-        if ty == 3:
-            sw[idx] = a0
+    for idx, data, a in zip(bus_idx_list, raw['bus'], a0):
         param = {'idx': idx, 'name': data[1], 'Vn': data[2],
-                 'v0': data[7], 'a0': a0,
+                 'v0': data[7], 'a0': a,
                  'area': data[4], 'zone': data[5], 'owner': data[6]}
         out['Bus'].append(param)
 
@@ -362,15 +393,19 @@ def _parse_load_v33(raw, system):
     mva = system.config.mva
     out = defaultdict(list)
 
-    for data in raw['load']:
-        bus = data[0]
+    # look up the bus rows once and read `Vn` and `v0` from the same rows
+    bus_uid = system.Bus.idx2uid([data[0] for data in raw['load']])
+    bus_vn = system.Bus.Vn.v
+    v0 = np.asarray(system.Bus.v0.v, dtype=float)[bus_uid]
 
-        vn = system.Bus.get(src='Vn', idx=bus, attr='v')
-        v0 = system.Bus.get(src='v0', idx=bus, attr='v')
+    # convert the ZIP load components into constant power loads at `v0`
+    zip_mw = np.array([data[5:11] for data in raw['load']], dtype=float).reshape(-1, 6)
+    p0 = (zip_mw[:, 0] + zip_mw[:, 2] * v0 + zip_mw[:, 4] * v0 ** 2) / mva
+    q0 = (zip_mw[:, 1] + zip_mw[:, 3] * v0 - zip_mw[:, 5] * v0 ** 2) / mva
 
-        param = {'bus': bus, 'u': data[2], 'Vn': vn,
-                 'p0': (data[5] + data[7] * v0 + data[9] * v0 ** 2) / mva,
-                 'q0': (data[6] + data[8] * v0 - data[10] * v0 ** 2) / mva,
+    for data, uid, p, q in zip(raw['load'], bus_uid, p0, q0):
+        param = {'bus': data[0], 'u': data[2], 'Vn': bus_vn[uid],
+                 'p0': p, 'q0': q,
                  'owner': data[11]}
 
         out['PQ'].append(param)
@@ -386,10 +421,11 @@ def _parse_fshunt_v33(raw, system):
 
     mva = system.config.mva
     out = defaultdict(list)
+    bus_vn = _bus_vn_map(system)
 
     for data in raw['fshunt']:
         bus = data[0]
-        vn = system.Bus.get(src='Vn', idx=bus, attr='v')
+        vn = bus_vn[bus]
 
         param = {'bus': bus, 'Vn': vn, 'u': data[2],
                  'Sn': mva, 'g': data[3] / mva, 'b': data[4] / mva}
@@ -416,12 +452,13 @@ def _parse_gen_v33(raw, system, sw):
     mva = system.config.mva
     out = defaultdict(list)
     gen_idx = 0
+    bus_vn = _bus_vn_map(system)
 
     for data in raw['gen']:
 
         bus = data[0]
         subidx = data[1]
-        vn = system.Bus.get(src='Vn', idx=bus, attr='v')
+        vn = bus_vn[bus]
         gen_mva = data[8]
         gen_idx += 1
         status = data[14]
@@ -458,14 +495,16 @@ def _parse_line_v33(raw, system):
     #
 
     out = defaultdict(list)
+    bus_vn = _bus_vn_map(system)
+
     for data in raw['branch']:
         param = {
             'u': data[13],
             'bus1': data[0], 'bus2': data[1],
             'r': data[3], 'x': data[4], 'b': data[5],
             'rate_a': data[6], 'rate_b': data[7], 'rate_c': data[8],
-            'Vn1': system.Bus.get(src='Vn', idx=data[0], attr='v'),
-            'Vn2': system.Bus.get(src='Vn', idx=data[1], attr='v'),
+            'Vn1': bus_vn[data[0]],
+            'Vn2': bus_vn[data[1]],
         }
         out['Line'].append(param)
 
@@ -478,6 +517,7 @@ def _parse_transf_v33(raw, system, max_bus):
 
     out = defaultdict(list)
     xf_3_count = 1
+    bus_vn = _bus_vn_map(system)
 
     for data in raw['transf']:
         if len(data) == 4:
@@ -491,8 +531,8 @@ def _parse_transf_v33(raw, system, max_bus):
             # """
 
             Sn = system.config.mva
-            bus_Vn1 = system.Bus.get(src='Vn', idx=data[0][0], attr='v')
-            bus_Vn2 = system.Bus.get(src='Vn', idx=data[0][1], attr='v')
+            bus_Vn1 = bus_vn[data[0][0]]
+            bus_Vn2 = bus_vn[data[0][1]]
 
             Vn1 = data[2][1] if data[2][1] != 0.0 else bus_Vn1
             Vn2 = data[3][1] if data[3][1] != 0.0 else bus_Vn2
@@ -550,7 +590,7 @@ def _parse_transf_v33(raw, system, max_bus):
 
             new_bus = data[0][2] + 1
 
-            if new_bus in system.Bus.idx.v:
+            if new_bus in bus_vn:
                 new_bus = max_bus + xf_3_count
                 logger.warning('Added bus <%s> for 3-winding transformer <%s-%s-%s>',
                                new_bus, data[0][0], data[0][1], data[0][2])
@@ -583,7 +623,7 @@ def _parse_transf_v33(raw, system, max_bus):
                          'x': x[i],
                          'tap': data[2+i][0],
                          'phi': data[2+i][2] * deg2rad,
-                         'Vn1': system.Bus.get(src='Vn', idx=data[0][i], attr='v'),
+                         'Vn1': bus_vn[data[0][i]],
                          'Vn2': 1.0,
                          }
 
@@ -603,9 +643,11 @@ def _parse_swshunt_v33(raw, system):
 
     out = defaultdict(list)
     mva = system.config.mva
+    bus_vn = _bus_vn_map(system)
+
     for data in raw['swshunt']:
         bus = data[0]
-        vn = system.Bus.get(src='Vn', idx=bus, attr='v')
+        vn = bus_vn[bus]
         param = {'bus': bus, 'Vn': vn, 'Sn': mva, 'u': data[3],
                  'b': data[9] / mva}
 
@@ -651,8 +693,7 @@ def _add_devices_from_dict(params, system):
 
     """
     for name, plist in params.items():
-        for p in plist:
-            system.add(name, p)
+        system.add_bulk(name, plist)
 
 
 def sort_psse_models(dyr_yaml, system):
@@ -110,8 +110,7 @@ def read(system, infile):
     for name, df in df_models.items():
         # drop rows that all nan
         df.dropna(axis=0, how='all', inplace=True)
-        for row in df.to_dict(orient='records'):
-            system.add(name, row)
+        system.add_bulk(name, df.to_dict(orient='records'))
 
     # --- for debugging ---
     system.df_in = df_models
@@ -13,6 +13,16 @@ class CuPySolver(SciPySolver):
     CuPy lsqr solver (GPU-based).
     """
 
+    def __init__(self):
+        super().__init__()
+        self.cu_A = None
+        self.cu_pattern = None
+
+    def clear(self):
+        super().clear()
+        self.cu_A = None
+        self.cu_pattern = None
+
     def solve(self, A, b):
         # delayed import for startup speed
         from cupyx.scipy.sparse import csc_matrix as csc_cu  # NOQA
@@ -20,8 +30,14 @@ class CuPySolver(SciPySolver):
 
         A_csc = self.to_csc(A)
 
-        cu_A = csc_cu(A_csc)
+        # the index arrays are uploaded to the device only when the sparsity pattern changes
+        if self.cu_pattern is not self.A_pattern:
+            self.cu_A = csc_cu(A_csc)
+            self.cu_pattern = self.A_pattern
+        else:
+            self.cu_A.data.set(A_csc.data)
+
         cu_b = cupy.array(np.array(b).ravel())
-        x = cu_lsqr(cu_A, cu_b)
+        x = cu_lsqr(self.cu_A, cu_b)
 
         return np.ravel(cupy.asnumpy(x[0]))
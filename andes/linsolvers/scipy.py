@@ -19,6 +19,28 @@ class SciPySolver:
         # when `new_A` is True, rebuild and factorize A
         self.new_A = True
 
+        self.A_csc = None
+        self.A_pattern = None
+        self.lu = None
+
+    def to_csc(self, A):
+        """
+        Convert ``A`` to ``scipy.sparse.csc_matrix``.
+
+        The converted matrix is cached, and only its values are updated
+        while the sparsity pattern of ``A`` is unchanged.
+        """
+        ccs = A.CCS
+        pattern = (A.size, bytes(memoryview(ccs[0])), bytes(memoryview(ccs[1])))
+
+        if pattern != self.A_pattern:
+            self.A_csc = spmatrix_to_csc(A)
+            self.A_pattern = pattern
+        else:
+            self.A_csc.data[:] = np.ravel(ccs[2])
+
+        return self.A_csc
+
     def solve(self, A, b):
         """
         Solve linear systems.
@@ -45,7 +67,14 @@ class SciPySolver:
         return self.solve(A, b)
 
     def clear(self):
-        pass
+        """
+        Remove the cached matrix and factorization.
+        """
+        self.A_csc = None
+        self.A_pattern = None
+        self.lu = None
+        self.factorize = True
+        self.new_A = True
 
 
 class SpSolve(SciPySolver):
@@ -56,7 +85,7 @@ class SpSolve(SciPySolver):
     def solve(self, A, b):
 
         if self.factorize or self.new_A:
-            A_csc = spmatrix_to_csc(A)
+            A_csc = self.to_csc(A)
             self.lu = splu(A_csc)
 
             self.factorize = False
@@ -70,7 +99,7 @@ class SpSolve(SciPySolver):
         Solve using `spsolve`.
         """
 
-        A_csc = spmatrix_to_csc(A)
+        A_csc = self.to_csc(A)
         b = np.ravel(b)
         return spsolve(A_csc, b)
 
@@ -96,3 +125,85 @@ def spmatrix_to_csc(A):
     indices = np.array(ccs[1]).ravel()
     indptr = np.array(ccs[0]).ravel()
     return csc_matrix((data, indices, indptr), shape=size)
+
+
+class BlockCSCAssembler:
+    """
+    Assemble ``kvxopt.spmatrix`` blocks ``[[A11, A12], [A21, A22]]`` into a
+    ``scipy.sparse.csc_matrix`` with a cached layout.
+
+    The column pointers, the row indices and the positions of the block values in
+    the assembled matrix are computed once for each sparsity pattern of the blocks.
+    Subsequent calls only scatter the block values into a new value array.
+    """
+
+    def __init__(self):
+        self.key = None
+        self.shape = None
+        self.indptr = None
+        self.indices = None
+        self.pos = None
+
+    def assemble(self, a11, a12, a21, a22):
+        """
+        Return the assembled matrix ``[[a11, a12], [a21, a22]]``.
+
+        Parameters
+        ----------
+        a11, a12, a21, a22 : kvxopt.spmatrix
+            Blocks of the matrix. Blocks in the same block row (column) shall
+            have the same number of rows (columns).
+
+        Returns
+        -------
+        scipy.sparse.csc_matrix
+            Assembled matrix
+        """
+        # blocks in the column-major order of CCS storage
+        blocks = (a11, a21, a12, a22)
+        ccs = [blk.CCS for blk in blocks]
+
+        key = tuple(blk.size for blk in blocks) + \
+            tuple(bytes(memoryview(item)) for c in ccs for item in c[:2])
+        if key != self.key:
+            self._build_layout(blocks, ccs)
+            self.key = key
+
+        data = np.empty(len(self.indices))
+        for pos, c in zip(self.pos, ccs):
+            data[pos] = np.ravel(c[2])
+
+        return csc_matrix((data, self.indices, self.indptr), shape=self.shape)
+
+    def _build_layout(self, blocks, ccs):
+        """
+        Compute the CCS layout of the assembled matrix.
+        """
+        n_top = blocks[0].size[0]
+        self.shape = (n_top + blocks[1].size[0], blocks[0].size[1] + blocks[2].size[1])
+
+        indptr, indices, self.pos = [np.zeros(1, dtype=int)], [], []
+        nnz = 0
+
+        # each block column stacks the top block over the bottom one
+        for (top, bottom) in ((ccs[0], ccs[1]), (ccs[2], ccs[3])):
+            t_ptr, b_ptr = np.ravel(top[0]), np.ravel(bottom[0])
+            t_cnt, b_cnt = np.diff(t_ptr), np.diff(b_ptr)
+            ptr = nnz + np.concatenate(([0], np.cumsum(t_cnt + b_cnt)))
+
+            t_col = np.repeat(np.arange(len(t_cnt)), t_cnt)
+            b_col = np.repeat(np.arange(len(b_cnt)), b_cnt)
+            t_pos = ptr[t_col] + np.arange(len(t_col)) - t_ptr[t_col]
+            b_pos = ptr[b_col] + t_cnt[b_col] + np.arange(len(b_col)) - b_ptr[b_col]
+
+            col_indices = np.empty(len(t_pos) + len(b_pos), dtype=int)
+            col_indices[t_pos - nnz] = np.ravel(top[1])
+            col_indices[b_pos - nnz] = np.ravel(bottom[1]) + n_top
+
+            indptr.append(ptr[1:])
+            indices.append(col_indices)
+            self.pos.extend((t_pos, b_pos))
+            nnz = ptr[-1]
+
+        self.indptr = np.concatenate(indptr)
+        self.indices = np.concatenate(indices)
@@ -22,6 +22,7 @@ class SuiteSparseSolver:
         self.b = None
         self.F = None   # symbolic factorization
         self.N = None   # numeric factorization
+        self.F_pattern = None  # sparsity pattern for which `F` was computed
         self.factorize = True
         self.new_A = False  # does not need to handle new A in suitesparse solvers
         self.use_linsolve = False
@@ -34,9 +35,20 @@ class SuiteSparseSolver:
         self.b = None
         self.F = None   # symbolic factorization
         self.N = None   # numeric factorization
+        self.F_pattern = None
         self.factorize = True
         self.use_linsolve = False
 
+    @staticmethod
+    def _pattern(A):
+        """
+        Return the sparsity pattern of sparse matrix ``A`` as a comparable tuple.
+
+        The tuple contains the size, the column pointers and the row indices of ``A``.
+        """
+        colptr, rowidx, _ = A.CCS
+        return A.size, bytes(memoryview(colptr)), bytes(memoryview(rowidx))
+
     def _symbolic(self, A):
         """
         Return the symbolic factorization of sparse matrix ``A``.
@@ -96,6 +108,8 @@ class SuiteSparseSolver:
         Store the solution in ``b``.
 
         This function caches the symbolic factorization in ``self.F`` and is faster in general.
+        The symbolic factorization is recomputed only if the sparsity pattern of ``A`` differs
+        from the one ``self.F`` was computed for, regardless of ``self.factorize``.
         Will attempt ``Solver.linsolve`` if the cached symbolic factorization is invalid.
 
         Parameters
@@ -117,9 +131,13 @@ class SuiteSparseSolver:
         self.A = A
         self.b = b
 
-        if self.factorize is True:
+        # repeated solves with an unchanged pattern, such as in successive Newton
+        # iterations or runs on the same topology, reuse the symbolic factorization
+        pattern = self._pattern(self.A)
+        if pattern != self.F_pattern:
             self.F = self._symbolic(self.A)
-            self.factorize = False
+            self.F_pattern = pattern
+        self.factorize = False
 
         try:
             self.N = self._numeric(self.A, self.F)
@@ -129,6 +147,7 @@ class SuiteSparseSolver:
         except ValueError:
             logger.debug('Unexpected symbolic factorization.')
             self.F = self._symbolic(self.A)
+            self.F_pattern = self._pattern(self.A)
             self.solve(self.A, self.b)
 
             return np.ravel(self.b)
@@ -15,7 +15,7 @@ class DGPRCTBaseData(ModelData):
     """
 
     def __init__(self):
-        super(DGPRCTBaseData, self).__init__()
+        super().__init__()
 
         self.dev = IdxParam(info='idx of the target device',
                             mandatory=True,
@@ -521,14 +521,14 @@ class StaticGen(GroupBase):
 
 class ACLine(GroupBase):
     def __init__(self):
-        super(ACLine, self).__init__()
+        super().__init__()
         self.common_params.extend(('bus1', 'bus2', 'r', 'x'))
         self.common_vars.extend(('v1', 'v2', 'a1', 'a2'))
 
 
 class ACShort(GroupBase):
     def __init__(self):
-        super(ACShort, self).__init__()
+        super().__init__()
         self.common_params.extend(('bus1', 'bus2'))
         self.common_vars.extend(('v1', 'v2', 'a1', 'a2'))
 
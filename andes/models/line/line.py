@@ -322,11 +322,7 @@ class Line(LineData, Model):
         self.Bdc -= spmatrix(y12 / mconj, self.a1.a, self.a2.a, (nb, nb), 'z')
         self.Bdc -= spmatrix(y12 / m, self.a2.a, self.a1.a, (nb, nb), 'z')
         self.Bdc += spmatrix(y12 + y2, self.a2.a, self.a2.a, (nb, nb), 'z')
-        self.Bdc = self.Bdc.imag()
-
-        for item in range(nb):
-            if abs(self.Bdc[item, item]) == 0:
-                self.Bdc[item, item] = 1e-6 + 0j
+        self.Bdc = _fill_zero_diag(self.Bdc.imag())
 
         return self.Bdc
 
@@ -372,11 +368,7 @@ class Line(LineData, Model):
         self.Bpp -= spmatrix(y12 / np.conj(m), self.a1.a, self.a2.a, (nb, nb), 'z')
         self.Bpp -= spmatrix(y12 / m, self.a2.a, self.a1.a, (nb, nb), 'z')
         self.Bpp += spmatrix(y12 + y2, self.a2.a, self.a2.a, (nb, nb), 'z')
-        self.Bpp = self.Bpp.imag()
-
-        for item in range(nb):
-            if abs(self.Bpp[item, item]) == 0:
-                self.Bpp[item, item] = 1e-6 + 0j
+        self.Bpp = _fill_zero_diag(self.Bpp.imag())
 
         return self.Bpp
 
@@ -401,10 +393,27 @@ class Line(LineData, Model):
         self.Bdc -= spmatrix(y12, self.a1.a, self.a2.a, (nb, nb), 'z')
         self.Bdc -= spmatrix(y12, self.a2.a, self.a1.a, (nb, nb), 'z')
         self.Bdc += spmatrix(y12, self.a2.a, self.a2.a, (nb, nb), 'z')
-        self.Bdc = self.Bdc.imag()
-
-        for item in range(nb):
-            if abs(self.Bdc[item, item]) == 0:
-                self.Bdc[item, item] = 1e-6
+        self.Bdc = _fill_zero_diag(self.Bdc.imag())
 
         return self.Bdc
+
+
+def _fill_zero_diag(B, eps=1e-6):
+    """
+    Return the real square sparse matrix ``B`` with zero diagonal elements set to ``eps``.
+
+    Zero diagonal elements are found with array operations on the triplets
+    and filled with one sparse addition.
+    """
+    n = B.size[0]
+    row, col, val = np.array(B.I).ravel(), np.array(B.J).ravel(), np.array(B.V).ravel()
+    on_diag = row == col
+
+    diag = np.zeros(n)
+    diag[row[on_diag]] = val[on_diag]
+    zeros = np.flatnonzero(diag == 0)
+
+    if len(zeros) > 0:
+        B = B + spmatrix(eps, zeros, zeros, (n, n), 'd')
+
+    return B
@@ -15,7 +15,7 @@ logger = logging.getLogger(__name__)
 
 class ToggleData(ModelData):
     def __init__(self):
-        super(ToggleData, self).__init__()
+        super().__init__()
         self.model = DataParam(info='model or group name of the device',
                                mandatory=True,
                                )
@@ -5,7 +5,7 @@ Integration methods for DAE.
 import logging
 import numpy as np
 
-from andes.shared import sparse, matrix, tqdm
+from andes.shared import idamax, sparse, tqdm
 
 
 logger = logging.getLogger(__name__)
@@ -55,6 +55,9 @@ class ImplicitIter:
         tds.y0[:] = dae.y
         tds.f0[:] = dae.f
 
+        # the linear solver call is loop-invariant
+        solve = tds.solver.linsolve if tds.config.linsolve else tds.solver.solve
+
         while True:
             tds.fg_update(models=system.exist.pflow_tds)
 
@@ -108,11 +111,10 @@ class ImplicitIter:
             else:
                 tds.qg[dae.n:] = dae.g
 
-            # calculate variable corrections
-            if not tds.config.linsolve:
-                inc = tds.solver.solve(tds.Ac, matrix(tds.qg))
-            else:
-                inc = tds.solver.linsolve(tds.Ac, matrix(tds.qg))
+            # calculate variable corrections. The residuals are copied into `qg_rhs` through
+            # its numpy view to avoid allocating a new RHS in each iteration.
+            np.asarray(tds.qg_rhs)[:, 0] = tds.qg
+            inc = solve(tds.Ac, tds.qg_rhs)
 
             # check for np.nan first
             if np.isnan(inc).any():
@@ -125,14 +127,15 @@ class ImplicitIter:
             if tds.config.reset_tiny:
                 inc[np.where(np.abs(inc) < tds.tol_zero)] = 0
 
-            # store `inc` to tds for debugging
-            tds.inc = inc
+            # store `inc` to tds for debugging. A copy is stored because
+            # in-place solvers return a view of `tds.qg_rhs`, which is refilled next iteration
+            tds.inc = inc.copy()
 
             # retrieve maximum abs. residual and maximum var. correction
-            mis_arg = np.argmax(np.abs(inc))
+            mis_arg = idamax(inc)
             mis_inc = inc[mis_arg]
 
-            mis_qg_arg = np.argmax(np.abs(tds.qg))
+            mis_qg_arg = idamax(tds.qg)
             mis_qg = tds.qg[mis_qg_arg]
 
             # store initial maximum mismatch
@@ -13,7 +13,7 @@ from scipy.linalg import solve
 from andes.io.txt import dump_data
 from andes.plot import set_latex, set_style
 from andes.routines.base import BaseRoutine
-from andes.shared import div, matrix, plt, sparse, spdiag, spmatrix
+from andes.shared import matrix, plt, sparse, spdiag, spmatrix
 from andes.utils.misc import elapsed
 from andes.variables.report import report_info
 
@@ -352,11 +352,11 @@ class EIG(BaseRoutine):
 
         # set parameters and run cases
         for count, val in enumerate(zip(*values)):
-            logger.debug(f"Parameter sweep: round={count}")
+            logger.debug("Parameter sweep: round=%d", count)
 
             for idx, (param, pos) in enumerate(zip(params, positions)):
                 param.v[pos] = val[idx]
-                logger.debug(f"Set {param.name} = {param.v[pos]}")
+                logger.debug("Set %s = %s", param.name, param.v[pos])
 
             self.system.TDS.init()
             self.system.TDS.itm_step()
@@ -514,7 +514,7 @@ class EIG(BaseRoutine):
         self.exec_time = t2 - t1
 
         logger.info(self.stats())
-        logger.info('Eigenvalue analysis finished in {:s}.'.format(s))
+        logger.info('Eigenvalue analysis finished in %s.', s)
 
         if not self.system.files.no_output:
             self.report()
@@ -693,20 +693,18 @@ class EIG(BaseRoutine):
                 marker = ''
             numeral[idx] = '#' + str(idx + 1) + marker
 
-        # compute frequency, un-damped frequency and damping
+        # compute frequency, un-damped frequency and damping of oscillatory modes
         freq = np.zeros(n_states)
         ufreq = np.zeros(n_states)
         damping = np.zeros(n_states)
 
-        for idx, item in enumerate(self.mu):
-            if item.imag == 0:
-                freq[idx] = 0
-                ufreq[idx] = 0
-                damping[idx] = 0
-            else:
-                ufreq[idx] = abs(item) / 2 / pi
-                freq[idx] = abs(item.imag / 2 / pi)
-                damping[idx] = -div(item.real, abs(item)) * 100
+        osc = self.mu.imag != 0
+        mu_osc = self.mu[osc]
+        mu_abs = np.abs(mu_osc)
+
+        ufreq[osc] = mu_abs / 2 / pi
+        freq[osc] = np.abs(mu_osc.imag / 2 / pi)
+        damping[osc] = -(mu_osc.real / mu_abs) * 100
 
         return freq, ufreq, damping, numeral
 
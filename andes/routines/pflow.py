@@ -2,17 +2,31 @@
 Module for power flow calculation.
 """
 
+import inspect
 import logging
 from collections import OrderedDict
+from functools import lru_cache
 
 from andes.utils.misc import elapsed
 from andes.routines.base import BaseRoutine
 from andes.variables.report import Report
-from andes.shared import np, matrix, sparse, newton_krylov
+from andes.linsolvers.scipy import BlockCSCAssembler
+from andes.shared import np, matrix, sparse, newton_krylov, LinearOperator, splu, lgmres
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _lgmres_tol_name():
+    """
+    Name of the relative tolerance argument of ``lgmres``, which is ``tol``
+    before SciPy 1.12 and ``rtol`` since.
+    """
+    from scipy.sparse.linalg import lgmres as func  # NOQA
+
+    return 'rtol' if 'rtol' in inspect.signature(func).parameters else 'tol'
+
+
 class PFlow(BaseRoutine):
     """
     Power flow calculation routine.
@@ -53,6 +67,9 @@ class PFlow(BaseRoutine):
         self.converged = False
         self.inc = None
         self.A = None
+        self.jac_asm = BlockCSCAssembler()  # CSC assembler of the full Jacobian
+        self._nk_outer_v = []  # LGMRES augmentation vectors recycled across Newton steps
+        self._fg_xy = None  # point at which the residuals in DAE are current, if known
         self.niter = 0
         self.mis = [1]
         self.models = OrderedDict()
@@ -122,8 +139,10 @@ class PFlow(BaseRoutine):
             self.solver.worker.new_A = True
 
         # ---------- prepare and solve linear equations ----------
-        self.res[:system.dae.n] = -system.dae.f[:]
-        self.res[system.dae.n:] = -system.dae.g[:]
+        # fill the preallocated RHS in place through its numpy view
+        res = np.asarray(self.res)[:, 0]
+        np.negative(system.dae.f, out=res[:system.dae.n])
+        np.negative(system.dae.g, out=res[system.dae.n:])
 
         self.A = sparse([[system.dae.fx, system.dae.gx],
                          [system.dae.fy, system.dae.gy]])
@@ -184,6 +203,11 @@ class PFlow(BaseRoutine):
                 logger.error('Mismatch increased too fast. Convergence is not likely.')
                 break
 
+            # steady growth beyond the initial mismatch indicates divergence
+            if len(self.mis) >= 3 and mis > self.mis[-2] > self.mis[-3] and mis > self.mis[0]:
+                logger.error('Mismatch increased in consecutive iterations. Convergence is not likely.')
+                break
+
             self.niter += 1
 
         return self.converged
@@ -193,11 +217,6 @@ class PFlow(BaseRoutine):
         Output a summary for the PFlow routine.
         """
 
-        # extract package name of the solver
-        sp_module = sparse.__module__
-        if '.' in sp_module:
-            sp_module = sp_module.split('.')[0]
-
         out = list()
         out.append('')
         out.append('-> Power flow calculation')
@@ -244,7 +263,7 @@ class PFlow(BaseRoutine):
         self.exec_time = t1 - t0
 
         if not self.converged:
-            if abs(self.mis[-1] - self.mis[-2]) < self.config.tol:
+            if len(self.mis) > 1 and abs(self.mis[-1] - self.mis[-2]) < self.config.tol:
                 max_idx = np.argmax(np.abs(system.dae.xy))
                 name = system.dae.xy_name[max_idx]
                 logger.error('Mismatch is not correctable possibly due to large load-generation imbalance.')
@@ -306,8 +325,11 @@ class PFlow(BaseRoutine):
         -------
 
         """
-        self._set_xy(xy)
-        self.fg_update()
+        # residuals already evaluated at `xy`, such as by the preconditioner, are reused
+        if self._fg_xy is None or not np.array_equal(xy, self._fg_xy):
+            self._set_xy(xy)
+            self.fg_update()
+            self._fg_xy = np.array(xy)
 
         return self.system.dae.fg
 
@@ -326,6 +348,60 @@ class PFlow(BaseRoutine):
         system.l_update_eq(self.models, niter=0)
         system.fg_to_dae()
 
+    def _jac_csc(self):
+        """
+        Evaluate the full Jacobian at the current point as a CSC matrix.
+
+        Residuals and discrete states must be up to date.
+        """
+        system = self.system
+
+        system.j_update(self.models)
+
+        return self.jac_asm.assemble(system.dae.fx, system.dae.fy,
+                                     system.dae.gx, system.dae.gy)
+
+    def _nk_preconditioner(self):
+        """
+        Build a preconditioner for Newton-Krylov from the LU factorization
+        of the Jacobian at the current point.
+
+        Returns
+        -------
+        scipy.sparse.linalg.LinearOperator
+            Operator applying the inverse of the Jacobian
+        """
+        self.fg_update()
+        A = self._jac_csc()
+        lu = splu(A)
+
+        return LinearOperator(A.shape, matvec=lu.solve)
+
+    def _nk_inner_solve(self, A, b, rtol=None, tol=None, atol=0., maxiter=None, M=None):
+        """
+        Inner Krylov solver for Newton-Krylov using analytic Jacobian-vector products.
+
+        The finite-difference operator ``A`` from SciPy is replaced by the
+        Jacobian evaluated at the point of the last residual call, so that
+        each inner iteration costs a sparse matrix-vector product instead of
+        a residual evaluation.
+
+        The augmentation vectors of LGMRES are kept in ``self._nk_outer_v``
+        across Newton steps, so that each inner solve is warm-started with the
+        error directions found by the previous ones.
+
+        SciPy passes the relative tolerance as ``tol`` before version 1.12 and
+        as ``rtol`` since. Either is accepted and forwarded under the name the
+        installed ``lgmres`` supports.
+        """
+        if rtol is None:
+            rtol = 1e-5 if tol is None else tol
+        tol_kwarg = {_lgmres_tol_name(): rtol}
+
+        return lgmres(self._jac_csc(), b, atol=atol, maxiter=maxiter, M=M,
+                      outer_v=self._nk_outer_v, store_outer_Av=False, prepend_outer_v=True,
+                      **tol_kwarg)
+
     def newton_krylov(self, verbose=True):
         """
         Full Newton-Krylov method from SciPy.
@@ -349,7 +425,20 @@ class PFlow(BaseRoutine):
         v0 = system.dae.xy
 
         try:
-            ret = newton_krylov(self._fg_wrapper, v0, verbose=verbose)
+            # the Jacobian at the initial point preconditions the inner Krylov solver
+            inner_M = self._nk_preconditioner()
+        except RuntimeError as e:
+            logger.error('Jacobian at the initial point is singular. Newton-Krylov is not likely to converge.')
+            logger.error(e)
+            self.converged = False
+            return self.converged
+
+        try:
+            self._nk_outer_v = []
+            self._fg_xy = v0.copy()
+
+            ret = newton_krylov(self._fg_wrapper, v0, verbose=verbose,
+                                method=self._nk_inner_solve, inner_M=inner_M)
             self._set_xy(ret)
             self.converged = True
 
@@ -358,4 +447,6 @@ class PFlow(BaseRoutine):
             logger.error(e)
             self.converged = False
 
+        self._fg_xy = None
+
         return self.converged
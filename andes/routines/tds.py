@@ -140,6 +140,7 @@ class TDS(BaseRoutine):
         self.last_pc = 0.0
         self.Teye = None
         self.qg = np.array([])
+        self.qg_rhs = None
         self.tol_zero = self.config.tol / 1e6
 
         # internal status
@@ -229,6 +230,10 @@ class TDS(BaseRoutine):
         self.Teye = spdiag(system.dae.Tf.tolist())
         self.qg = np.zeros(system.dae.n + system.dae.m)
 
+        # RHS buffer reused by the linear solver. KLU and UMFPACK overwrite it with the
+        # solution, and the returned increment is a view of it
+        self.qg_rhs = matrix(0.0, (system.dae.n + system.dae.m, 1))
+
         self.initialized = True
 
         # test if residuals are close enough to zero
@@ -983,15 +988,15 @@ class TDS(BaseRoutine):
         logger.debug(f'{"xy_index":<10} {"Equation (row)":<20} {"Derivative":<20} {"Eq. Mismatch":<20}')
         for eq in eqns_idx:
             eq = eq.tolist()
-            logger.debug(f'{eq:<10} {self.system.dae.xy_name[eq]:<20} {assoc_eqns[eq]:<20g} '
-                         f'{self.system.dae.fg[eq]:<20g}')
+            logger.debug('%-10d %-20s %-20g %-20g', eq, self.system.dae.xy_name[eq],
+                         assoc_eqns[eq], self.system.dae.fg[eq])
 
         logger.debug('')
         logger.debug(f'{"xy_index":<10} {"Variable (col)":<20} {"Derivative":<20} {"Eq. Mismatch":<20}')
         for v in vars_idx:
             v = v.tolist()
-            logger.debug(f'{v:<10} {self.system.dae.xy_name[v]:<20} {assoc_vars[v]:<20g} '
-                         f'{self.system.dae.fg[v]:<20g}')
+            logger.debug('%-10d %-20s %-20g %-20g', v, self.system.dae.xy_name[v],
+                         assoc_vars[v], self.system.dae.fg[v])
 
     def reset(self):
         """
@@ -1004,6 +1009,7 @@ class TDS(BaseRoutine):
         self.last_pc = 0.0
         self.Teye = None
         self.qg = np.array([])
+        self.qg_rhs = None
 
         self.converged = False
         self.last_converged = False
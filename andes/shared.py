@@ -68,6 +68,10 @@ Pool = LazyImport('from pathos.multiprocessing import Pool')
 Process = LazyImport('from multiprocess import Process')
 
 newton_krylov = LazyImport('from scipy.optimize import newton_krylov')
+LinearOperator = LazyImport('from scipy.sparse.linalg import LinearOperator')
+splu = LazyImport('from scipy.sparse.linalg import splu')
+lgmres = LazyImport('from scipy.sparse.linalg import lgmres')
+idamax = LazyImport('from scipy.linalg.blas import idamax')
 fsolve = LazyImport('from scipy.optimize import fsolve')
 solve_ivp = LazyImport('from scipy.integrate import solve_ivp')
 odeint = LazyImport('from scipy.integrate import odeint')
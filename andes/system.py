@@ -145,6 +145,7 @@ class System:
                                      ('numba', 0),
                                      ('numba_parallel', 0),
                                      ('numba_nopython', 1),
+                                     ('numba_fastmath', 0),
                                      ('yapf_pycode', 0),
                                      ('save_stats', 0),
                                      ('np_divide', 'warn'),
@@ -161,6 +162,7 @@ class System:
                               numba='use numba for JIT compilation',
                               numba_parallel='enable parallel for numba.jit',
                               numba_nopython='nopython mode for numba',
+                              numba_fastmath='allow unsafe floating-point optimizations in numba',
                               yapf_pycode='format generated code with yapf',
                               save_stats='store statistics of function calls',
                               np_divide='treatment for division by zero',
@@ -176,6 +178,7 @@ class System:
                               numba=(0, 1),
                               numba_parallel=(0, 1),
                               numba_nopython=(0, 1),
+                              numba_fastmath=(0, 1),
                               yapf_pycode=(0, 1),
                               save_stats=(0, 1),
                               np_divide={'ignore', 'warn', 'raise', 'call', 'print', 'log'},
@@ -202,6 +205,7 @@ class System:
         self._getters = dict(f=list(), g=list(), x=list(), y=list())
         self._adders = dict(f=list(), g=list(), x=list(), y=list())
         self._setters = dict(f=list(), g=list(), x=list(), y=list())
+        self._adder_addr = dict()  # concatenated addresses of equation adders
         self.antiwindups = list()
         self.no_check_init = list()  # states for which initialization check is omitted
         self.call_stats = defaultdict(dict)  # call statistics storage
@@ -274,6 +278,7 @@ class System:
         self._getters = dict(f=list(), g=list(), x=list(), y=list())
         self._adders = dict(f=list(), g=list(), x=list(), y=list())
         self._setters = dict(f=list(), g=list(), x=list(), y=list())
+        self._adder_addr = dict()  # concatenated addresses of equation adders
 
     def prepare(self, quick=False, incremental=False, models=None, nomp=False, ncpu=NCPUS_PHYSICAL):
         """
@@ -284,7 +289,8 @@ class System:
         Parameters
         ----------
         quick : bool, optional
-            True to skip pretty-print generation to reduce code generation time.
+            True to skip pretty-print generation. Otherwise, pretty prints are
+            generated on first access.
         incremental : bool, optional
             True to generate only for modified models, incrementally.
         models : list, OrderedDict, None
@@ -563,6 +569,57 @@ class System:
 
         return idx
 
+    def add_bulk(self, model, rows):
+        """
+        Add multiple device instances for an existing model.
+
+        This method is equivalent to calling ``add`` for each element in `rows`,
+        but the parameter values are added to the model in bulk.
+
+        Parameters
+        ----------
+        model : str
+            Name of the model
+        rows : list of dict
+            Parameters of the devices, one dict for each device
+
+        Returns
+        -------
+        list
+            idx of the added devices
+        """
+        if model not in self.models and (model not in self.model_aliases):
+            logger.warning("<%s> is not an existing model.", model)
+            return
+
+        if self.is_setup:
+            raise NotImplementedError("Adding devices are not allowed after setup.")
+
+        mdl = self.__dict__[model]
+        group = self.groups[mdl.group]
+
+        keys = dict()
+        idxes = list()
+        for row in rows:
+            idx = row.get('idx', None)
+            if idx is not None and (not isinstance(idx, str) and np.isnan(idx)):
+                idx = None
+
+            idx = group.get_next_idx(idx=idx, model_name=model)
+            group.add(idx=idx, model=mdl)
+            idxes.append(idx)
+            keys.update(dict.fromkeys(row))
+
+        # remove `uid` field
+        keys.pop('uid', None)
+        keys.pop('idx', None)
+
+        columns = {key: [row.get(key) for row in rows] for key in keys}
+        columns['idx'] = idxes
+        mdl.add_bulk(columns)
+
+        return idxes
+
     def find_devices(self):
         """
         Add dependent devices for all model based on `DeviceFinder`.
@@ -698,11 +755,16 @@ class System:
                 continue
 
             for var in mdl.cache.vars_int.values():
-                var.set_arrays(self.dae, inplace=inplace, alloc=alloc)
+                var.set_arrays(self.dae, inplace=inplace, alloc=False)
+
+            if alloc:
+                mdl.alloc_arrays()
 
             for var in mdl.cache.vars_ext.values():
                 var.set_arrays(self.dae, inplace=inplace, alloc=alloc)
 
+            mdl._input_version += 1
+
     def _init_numba(self, models: OrderedDict):
         """
         Helper function to compile all functions with Numba before init.
@@ -721,12 +783,14 @@ class System:
 
         use_parallel = bool(self.config.numba_parallel)
         nopython = bool(self.config.numba_nopython)
+        fastmath = bool(self.config.numba_fastmath)
 
         logger.info("Numba compilation initiated with caching.")
 
         for mdl in models.values():
             mdl.numba_jitify(parallel=use_parallel,
                              nopython=nopython,
+                             fastmath=fastmath,
                              )
 
         return True
@@ -848,8 +912,9 @@ class System:
             # Fixes an issue if the cache was manually built but stale
             # after assigning addresses for simulation
             # Assigning memory will affect the cache of `v_adders` and `e_adders`.
+            # Cleared values are rebuilt on access, which skips unused data views.
 
-            mdl.cache.refresh()
+            mdl.cache.clear()
 
             # ``getters` that retrieve variable values from DAE
             for var in mdl.cache.v_getters.values():
@@ -872,6 +937,11 @@ class System:
                 if isinstance(item, AntiWindup):
                     self.antiwindups.append(item)
 
+        # equation values of all adders are collected into DAE in one call
+        for name in ('f', 'g'):
+            if len(self._adders[name]):
+                self._adder_addr[name] = np.concatenate([var.a for var in self._adders[name]])
+
         return
 
     def store_no_check_init(self, models):
@@ -1151,25 +1221,26 @@ class System:
 
             # for `gy`, reserve memory for the main diagonal
             if jname == 'gy':
-                ii.extend(np.arange(self.dae.m))
-                jj.extend(np.arange(self.dae.m))
-                vv.extend(np.zeros(self.dae.m))
+                ii.append(np.arange(self.dae.m))
+                jj.append(np.arange(self.dae.m))
+                vv.append(np.zeros(self.dae.m))
 
+            # collect arrays and concatenate once
             for mdl in models.values():
                 for row, col, val in mdl.triplets.zip_ijv(jname):
-                    ii.extend(row)
-                    jj.extend(col)
-                    vv.extend(np.zeros_like(row))
+                    ii.append(row)
+                    jj.append(col)
+                    vv.append(np.zeros(len(row)))
                 for row, col, val in mdl.triplets.zip_ijv(jname + 'c'):
                     # process constant Jacobians separately
-                    ii.extend(row)
-                    jj.extend(col)
-                    vv.extend(val * np.ones_like(row))
+                    ii.append(row)
+                    jj.append(col)
+                    vv.append(val * np.ones(len(row)))
 
             if len(ii) > 0:
-                ii = np.array(ii, dtype=int)
-                jj = np.array(jj, dtype=int)
-                vv = np.array(vv, dtype=float)
+                ii = np.concatenate(ii).astype(int)
+                jj = np.concatenate(jj).astype(int)
+                vv = np.concatenate(vv).astype(float)
 
             self.dae.store_sparse_ijv(jname, ii, jj, vv)
             self.dae.build_pattern(jname)
@@ -1270,9 +1341,10 @@ class System:
         island_sets = []
         starting_bus = 0
         visit_idx = 0
+        islanded_set = set(self.Bus.islanded_buses)
 
         while True:
-            if starting_bus in self.Bus.islanded_buses:
+            if starting_bus in islanded_set:
                 starting_bus += 1
                 continue
 
@@ -1295,8 +1367,9 @@ class System:
 
             # Increment `starting_bus` until it's not in `conn.J` and
             # `self.Bus.islanded_buses`
+            conn_set = set(conn.J)
             for i in range(visit_idx, self.Bus.n):
-                if i in conn.J or i in self.Bus.islanded_buses:
+                if i in conn_set or i in islanded_set:
                     i += 1
                 else:
                     visit_idx = i
@@ -1308,10 +1381,11 @@ class System:
 
         # --- check if all areas have a slack generator ---
         if len(self.Bus.island_sets) > 0:
+            slack_bus_uid = self.Bus.idx2uid(self.Slack.bus.v)
+            slack_u = self.Slack.u.v
             for idx, island in enumerate(self.Bus.island_sets):
                 nosw = 1
-                slack_bus_uid = self.Bus.idx2uid(self.Slack.bus.v)
-                slack_u = self.Slack.u.v
+                island = set(island)
                 for u, item in zip(slack_u, slack_bus_uid):
                     if (u == 1) and (item in island):
                         nosw -= 1
@@ -1449,8 +1523,10 @@ class System:
             eq_name = [eq_name]
 
         for name in eq_name:
-            for var in self._adders[name]:
-                np.add.at(self.dae.__dict__[name], var.a, var.e)
+            adders = self._adders[name]
+            if len(adders):
+                np.add.at(self.dae.__dict__[name], self._adder_addr[name],
+                          np.concatenate([var.e for var in adders]))
             for var in self._setters[name]:
                 np.put(self.dae.__dict__[name], var.a, var.e)
 
@@ -1598,7 +1674,7 @@ class System:
 
             # reload stored variables
             for item in dilled_vars:
-                model.calls.__dict__[item] = pycode_model.__dict__[item]
+                setattr(model.calls, item, pycode_model.__dict__[item])
 
             # equations
             model.calls.f = pycode_model.__dict__.get("f_update")
@@ -1691,10 +1767,11 @@ class System:
 
         """
         ret = OrderedDict()
+        save_stats = self.config.save_stats
         for name, mdl in models.items():
             ret[name] = getattr(mdl, method)(*args, **kwargs)
 
-            if self.config.save_stats:
+            if save_stats:
                 if method not in self.call_stats[name]:
                     self.call_stats[name][method] = 1
                 else:
@@ -2196,7 +2273,7 @@ def fix_view_arrays(system):
     This function properly sets ``v`` and ``e`` arrays of internal variables as
     views of the corresponding DAE arrays.
 
-    Inputs will be refreshed for each model.
+    Inputs will be refreshed and Jacobian views will be reset for each model.
 
     Parameters
     ----------
@@ -2208,6 +2285,7 @@ def fix_view_arrays(system):
 
     for model in system.models.values():
         model.get_inputs(refresh=True)
+        model.set_jac_views()
 
     return True
 
@@ -42,6 +42,7 @@ class LazyImport:
 
         self.__complementary_imports__ = []
         self.__was_imported__ = False
+        self.__imported_object__ = None
 
     def __on_import__(self, lazy_import):
         self.__complementary_imports__.append(lazy_import)
@@ -58,26 +59,31 @@ class LazyImport:
 
     # Python will only import the module(s) if they are missing
     # if the module(s) were imported before, this method returns immediately
+    # without executing the import statement again
     def __maybe_import__(self):
+        if self.__imported_object__ is not None:
+            return
+
         self.__maybe_import_complementary_imports__()
         exec(self.__import_statement__, globals())
-        # Attention: if the import fails, the next line will not be reached
+        # Attention: if the import fails, the next lines will not be reached
+        self.__imported_object__ = eval(self.__imported_name__)
         self.__was_imported__ = True
 
     # among others, called during auto-completion of IPython/Jupyter
     def __dir__(self):
         self.__maybe_import__()
-        return eval(f"dir({self.__imported_name__})")
+        return dir(self.__imported_object__)
 
     # called for undefined attribute and returns the attribute of the imported module
     def __getattr__(self, attribute):
         self.__maybe_import__()
-        return eval(f"{self.__imported_name__}.{attribute}")
+        return getattr(self.__imported_object__, attribute)
 
     # called for callable objects, e.g. from pathlib import Path; Path(".")
     def __call__(self, *args, **kwargs):
         self.__maybe_import__()
-        return eval(self.__imported_name__)(*args, **kwargs)
+        return self.__imported_object__(*args, **kwargs)
 
     def __repr__(self, *args, **kwargs):
         # it is important that __repr__ does not trigger an import if the lazy_import is not yet imported
@@ -90,12 +96,15 @@ class LazyImport:
             # next line only adds imported_name into the local scope but does not trigger a new import
             # because the lazy_import was already imported via another trigger
             self.__maybe_import__()
-            return f"active pyforest.LazyImport of {eval(self.__imported_name__)}"
+            return f"active pyforest.LazyImport of {self.__imported_object__}"
         else:
             return f"lazy pyforest.LazyImport for '{self.__import_statement__}'"
 
     def __getstate__(self):
-        return vars(self)
+        # imported modules are not picklable; import again after unpickling
+        state = dict(vars(self))
+        state['__imported_object__'] = None
+        return state
 
     def __setstate__(self, state):
         vars(self).update(state)
@@ -1,10 +1,10 @@
 import logging
+import math
 from time import time
 
-from decimal import ROUND_DOWN, Decimal
-
 logger = logging.getLogger(__name__)
 _missing = object()
+_str_consts = {'True': True, 'False': False, 'None': None}
 
 
 def elapsed(t0=0.0):
@@ -21,11 +21,9 @@ def elapsed(t0=0.0):
     """
     t = time()
     dt = t - t0
-    dt_sec = Decimal(str(dt)).quantize(Decimal('.0001'), rounding=ROUND_DOWN)
-    if dt_sec == 1:
-        s = str(dt_sec) + ' second'
-    else:
-        s = str(dt_sec) + ' seconds'
+    # truncate to four decimal places
+    dt_sec = math.floor(dt * 10000) / 10000
+    s = f"{dt_sec:.4f} second{'' if dt_sec == 1 else 's'}"
     return t, s
 
 
@@ -40,21 +38,20 @@ def to_number(s):
         ret = ret.strip("'").strip()
 
     # try converting to booleans / None
-    if ret == 'True':
-        return True
-    elif ret == 'False':
-        return False
-    elif ret == 'None':
-        return None
-
-    # try converting to float or int
+    if ret in _str_consts:
+        return _str_consts[ret]
+
+    # integers are recognized by their digits and never go through `float`
+    digits = ret.strip()
+    if digits[:1] in ('+', '-'):
+        digits = digits[1:]
+    if digits.isdecimal():
+        return int(ret)
+
     try:
-        ret = int(ret)
+        ret = float(ret)
     except ValueError:
-        try:
-            ret = float(ret)
-        except ValueError:
-            pass
+        pass
 
     return ret
 
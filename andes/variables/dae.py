@@ -449,11 +449,10 @@ class DAE:
         elif isinstance(names, str):
             names = [names]
 
+        # scaling the template copies its stored pattern and values as is,
+        # which avoids sorting the triplets again as `spmatrix(V, I, J)` does
         for name in names:
-            self.__dict__[name] = spmatrix(self.tpl[name].V,
-                                           self.tpl[name].I,
-                                           self.tpl[name].J,
-                                           self.tpl[name].size, 'd')
+            self.__dict__[name] = self.tpl[name] * 1.0
 
     def reset(self):
         """
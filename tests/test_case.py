@@ -2,6 +2,7 @@ import os
 import unittest
 
 import numpy as np
+import pandas as pd
 
 import andes
 from andes.utils.paths import get_case
@@ -67,6 +68,11 @@ class Test5Bus(unittest.TestCase):
         self.ss.Bus.as_df()
         self.ss.Bus.as_df(vin=True)
 
+        # test dataframe from the packed parameter buffer
+        self.assertTrue(self.ss.Line._v_buffer_valid())
+        pd.testing.assert_frame_equal(self.ss.Line.as_df(),
+                                      pd.DataFrame(self.ss.Line.as_dict()).set_index('uid'))
+
         # test model initialization sequence
         self.ss.Bus.get_init_order()
 
@@ -146,6 +152,86 @@ class TestKundur2AreaEIG(unittest.TestCase):
         ss.EIG.run()
 
 
+class TestKundur2AreaNumba(unittest.TestCase):
+    """
+    Test Kundur's 2-area system with numba.
+    """
+
+    def test_numba_jacobians(self):
+        """
+        Test if numba-compiled Jacobians match the interpreted ones.
+        """
+        jacs = []
+        for numba in (0, 1):
+            ss = andes.run(get_case("kundur/kundur_full.xlsx"),
+                           no_output=True,
+                           default_config=True,
+                           config_option=[f"System.numba={numba}"],
+                           )
+            ss.TDS.init()
+            jacs.append([np.array(andes.shared.matrix(ss.dae.__dict__[name]))
+                         for name in andes.shared.jac_names])
+
+        for interpreted, compiled in zip(*jacs):
+            np.testing.assert_allclose(interpreted, compiled)
+
+
+class TestKundur2AreaJacobian(unittest.TestCase):
+    """
+    Test the assembly of the full Jacobian of Kundur's 2-area system.
+    """
+
+    def test_block_csc_assembler(self):
+        """
+        Test `BlockCSCAssembler` against the block matrix from kvxopt.
+        """
+        from andes.linsolvers.scipy import BlockCSCAssembler, spmatrix_to_csc
+
+        ss = andes.run(get_case("kundur/kundur_full.xlsx"),
+                       no_output=True,
+                       default_config=True,
+                       )
+        ss.TDS.init()
+        dae = ss.dae
+
+        expected = spmatrix_to_csc(andes.shared.sparse([[dae.fx, dae.gx], [dae.fy, dae.gy]]))
+
+        assembler = BlockCSCAssembler()
+        for _ in range(2):  # the second call uses the cached layout
+            assembled = assembler.assemble(dae.fx, dae.fy, dae.gx, dae.gy)
+            self.assertEqual(assembled.shape, expected.shape)
+            np.testing.assert_array_equal(assembled.toarray(), expected.toarray())
+
+
+class TestNewtonKrylov(unittest.TestCase):
+    """
+    Test the Newton-Krylov power flow against Newton-Raphson.
+    """
+
+    def test_nk_pflow(self):
+        """
+        Test NK power flow results and repeated runs.
+        """
+        for case in ("ieee14/ieee14.raw", "kundur/kundur_full.xlsx"):
+            ss = andes.run(get_case(case),
+                           no_output=True,
+                           default_config=True,
+                           )
+            xy_nr = ss.dae.xy
+
+            ss = andes.load(get_case(case),
+                            no_output=True,
+                            default_config=True,
+                            )
+            ss.PFlow.config.method = 'NK'
+
+            # the second run starts from the solution of the first one
+            for _ in range(2):
+                ss.PFlow.run()
+                self.assertTrue(ss.PFlow.converged)
+                np.testing.assert_array_almost_equal(ss.dae.xy, xy_nr, decimal=4)
+
+
 class TestKundur2AreaPSSE(unittest.TestCase):
     """
     Test Kundur's 2-area system in PSS/E format
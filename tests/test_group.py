@@ -82,6 +82,11 @@ class TestGroup(unittest.TestCase):
                                               [('PVD1_1', 'PVD1_2'),
                                                (1.0, 1.0)]))
 
+        self.assertListEqual(ss.PVD1.find_idx('name', ['PVD1_1', 'PVD1_X'],
+                                              allow_none=True, default=None),
+                             [1, None])
+        self.assertRaises(IndexError, ss.PVD1.find_idx, 'name', ['PVD1_X'])
+
         # --- get_field ---
         ff = ss.DG.get_field('f', list(ss.DG._idx2model.keys()), 'v_code')
         self.assertTrue(any([item == 'y' for item in ff]))
@@ -23,6 +23,10 @@ class TestModelMethods(unittest.TestCase):
 
         omega_addr = ss.GENROU.omega.a.tolist()
 
+        uid = ss.GENROU.idx2uid(np.array(["GENROU_1", "GENROU_3"]))
+        self.assertIsInstance(uid, np.ndarray)
+        np.testing.assert_equal(uid, [0, 2])
+
         # set a single value
         ss.GENROU.set("M", "GENROU_1", "v", 2.0)
         self.assertEqual(ss.GENROU.M.v[0], 2.0)
@@ -54,3 +58,65 @@ class TestModelMethods(unittest.TestCase):
         ss.GENROU.set("M", np.array(["GENROU_4"]), "v", 6.0)
         np.testing.assert_equal(ss.GENROU.M.v[3], 6.0)
         self.assertEqual(ss.TDS.Teye[omega_addr[3], omega_addr[3]], 6.0)
+
+    def test_idx2uid_numba(self):
+        """
+        Test `Model.idx2uid()` with the numba lookup for integer idx.
+        """
+
+        ss = andes.load(
+            andes.get_case("ieee14/ieee14.json"),
+            default_config=True,
+            no_output=True,
+        )
+        ss.config.numba = 1
+
+        idx = np.array([3, 1, 14])
+        uid = ss.Bus.idx2uid(idx)
+        np.testing.assert_equal(uid, [ss.Bus.uid[i] for i in idx])
+
+        self.assertRaises(KeyError, ss.Bus.idx2uid, np.array([1, 999]))
+
+    def test_add_bulk(self):
+        """
+        Test `System.add_bulk()` against `System.add()`.
+        """
+
+        rows = [{'idx': 1, 'name': 'Bus A', 'Vn': 110},
+                {'idx': 2, 'Vn': 230, 'v0': 1.02},
+                {'idx': None, 'name': float('nan')},
+                ]
+
+        ss1 = andes.System()
+        for row in rows:
+            ss1.add('Bus', dict(row))
+
+        ss2 = andes.System()
+        idxes = ss2.add_bulk('Bus', rows)
+
+        self.assertListEqual(idxes, list(ss1.Bus.idx.v))
+        self.assertEqual(ss1.Bus.uid, ss2.Bus.uid)
+        self.assertEqual(ss1.ACTopology.uid, ss2.ACTopology.uid)
+        for name, param in ss1.Bus.params.items():
+            self.assertListEqual(list(param.v), list(ss2.Bus.params[name].v))
+
+    def test_cache_refresh_in_place(self):
+        """
+        Test that `ModelCache.refresh` reflects in-place writes to parameters.
+        """
+
+        ss = andes.run(
+            andes.get_case("kundur/kundur_full.xlsx"),
+            default_config=True,
+            no_output=True,
+        )
+
+        self.assertEqual(ss.GENROU.cache.df_in['M'].iloc[0], 13.0)
+
+        ss.GENROU.M.vin[0] = 99.0
+        ss.GENROU.cache.refresh('df_in')
+        self.assertEqual(ss.GENROU.cache.df_in['M'].iloc[0], 99.0)
+
+        ss.GENROU.M.v[0] = 98.0
+        ss.GENROU.cache.refresh('df')
+        self.assertEqual(ss.GENROU.cache.df['M'].iloc[0], 98.0)
@@ -43,3 +43,25 @@ class TestSnapshot(unittest.TestCase):
         np.testing.assert_almost_equal(ss.GENROU.omega.v,
                                        np.array([1.00524852, 1.00508697, 1.00423421, 1.0039603]),
                                        decimal=4)
+
+    def test_save_ss_spsolve(self):
+        """
+        Test saving a snapshot after factorizing with the SciPy solver.
+        """
+
+        ss = andes.run(andes.get_case("kundur/kundur_full.xlsx"),
+                       no_output=True,
+                       default_config=True,
+                       config_option=['PFlow.sparselib=spsolve', 'TDS.sparselib=spsolve'],
+                       )
+
+        ss.TDS.config.tf = 0.5
+        ss.TDS.run()
+
+        path = save_ss('kundur_full_spsolve.pkl', ss)
+        ss = load_ss(path)
+        os.remove(path)
+
+        ss.TDS.config.tf = 1.0
+        ss.TDS.run()
+        self.assertEqual(ss.exit_code, 0)